@@ -3,123 +3,224 @@ Chat endpoint - handles chat requests and responses with context awareness
 """
 
 from fastapi import APIRouter, HTTPException
-from uuid import UUID
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
 import logging
 
-from app.schemas.chat import ChatRequest, ChatResponse, ContextMessage
+import numpy as np
+import orjson
+
+from app.schemas.chat import ChatRequest, ChatResponse
+from app.models.chat_models import ChatMessage, ChatSession
 from app.services.ollama_service import ollama_service
-from app.services.chat_history_service import chat_history_service
+from app.services.chat_history_service import chat_history_service, SessionNotFoundError
+from app.services.embedding_batcher import embedding_batcher
+from app.services.semantic_cache import semantic_cache
+from app.core.config import settings
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Keep references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks = set()
+
+
+class _ChatTurn:
+    """State gathered before generating a reply for one chat request."""
+
+    def __init__(self, session: ChatSession):
+        self.session = session
+        self.query_embedding: Optional[np.ndarray] = None
+        self.cached_reply: Optional[str] = None
+        self.context_messages: List[Dict[str, Any]] = []
+        self.context_str: Optional[str] = None
+
+    @property
+    def session_id(self) -> str:
+        return str(self.session.session_id)
+
+    def context_used(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Format retrieved context for the response.
+
+        Returns plain dicts shaped like ContextMessage - the values come
+        straight from our own Qdrant payloads, so there is nothing to
+        validate per item.
+        """
+        if not self.context_messages:
+            return None
+
+        return [
+            {
+                "role": ctx['role'],
+                "content": ctx['content'],
+                "score": ctx['score'],
+                "timestamp": ctx.get('timestamp'),
+            }
+            for ctx in self.context_messages
+        ]
+
+
+async def _save_user_message(
+    session: ChatSession,
+    request: ChatRequest,
+    query_embedding: np.ndarray
+) -> ChatMessage:
+    """Store the user's message with its already computed embedding."""
+    user_message, _ = await asyncio.to_thread(
+        chat_history_service.save_message,
+        session_id=session.session_id,
+        role="user",
+        content=request.message,
+        generate_embedding=True,
+        precomputed_embedding=query_embedding
+    )
+    return user_message
+
+
+async def _prepare_chat_turn(request: ChatRequest) -> _ChatTurn:
+    """
+    Run the steps shared by /chat and /chat/stream up to generation.
+
+    Gets or creates the session, stores the user's message, checks the
+    semantic cache and, on a miss, retrieves and formats relevant context.
+    Blocking database, Qdrant and embedding work runs in worker threads.
+
+    Args:
+        request: ChatRequest with message and optional session_id
+
+    Returns:
+        _ChatTurn with the session, cached reply (if any) and context
+    """
+    # Step 1: Get or create session (session_id is validated as a UUID
+    # by the request schema)
+    session = await asyncio.to_thread(
+        chat_history_service.get_or_create_session,
+        session_id=request.session_id
+    )
+
+    # Embed the message once - the same vector is stored in Qdrant, used
+    # as the retrieval query and as the semantic cache key
+    query_embedding = await embedding_batcher.embed_async(request.message)
+
+    # Step 2: Store user message
+    try:
+        user_message = await _save_user_message(session, request, query_embedding)
+    except SessionNotFoundError:
+        # The session was served from this worker's cache but has been
+        # deleted meanwhile - continue in a new session, as for any
+        # unknown session ID (the stale cache entry is already dropped)
+        session = await asyncio.to_thread(
+            chat_history_service.get_or_create_session,
+            session_id=request.session_id
+        )
+        user_message = await _save_user_message(session, request, query_embedding)
+
+    logger.info(f"Using session: {session.session_id}")
+
+    turn = _ChatTurn(session)
+    turn.query_embedding = query_embedding
+
+    logger.info(f"Stored user message (ID: {user_message.id})")
+
+    # Check the semantic cache before doing retrieval and generation
+    if settings.semantic_cache_enabled:
+        turn.cached_reply = semantic_cache.lookup(turn.session_id, turn.query_embedding)
+
+    if turn.cached_reply is not None:
+        logger.info("Serving reply from semantic cache")
+        return turn
+
+    if settings.semantic_cache_enabled:
+        # A new prompt may add facts that cached replies didn't know about
+        # (e.g. the user's name), so they can no longer be reused
+        semantic_cache.invalidate(turn.session_id)
+
+    # Step 3: Retrieve relevant context (awaits the async Qdrant client)
+    turn.context_messages = await chat_history_service.get_relevant_context_async(
+        session_id=session.session_id,
+        query=request.message,
+        limit=5,
+        exclude_roles=None,  # Include all messages in context
+        precomputed_embedding=turn.query_embedding
+    )
+
+    logger.info(f"Retrieved {len(turn.context_messages)} context messages")
+
+    # Step 4: Format context for LLM
+    if turn.context_messages:
+        turn.context_str = chat_history_service.format_context_for_llm(
+            turn.context_messages
+        )
+
+    return turn
+
 
 @router.post("/chat", response_model=ChatResponse, tags=["chat"])
 async def chat(request: ChatRequest):
     """
     Context-aware chat endpoint with persistent history.
-    
+
+    Blocking database, Qdrant and embedding work runs in worker threads
+    so the event loop keeps serving other requests in the meantime.
+
     This endpoint:
     1. Gets or creates a chat session
     2. Stores the user's message
     3. Retrieves relevant context from past messages
-    4. Generates a context-aware response
+    4. Generates a context-aware response (or reuses a cached reply
+       for a semantically equivalent prompt in the same session)
     5. Stores the assistant's response
     6. Returns the reply with session info and context used
-    
+
     Args:
         request: ChatRequest with message and optional session_id
-        
+
     Returns:
         ChatResponse with reply, session_id, and context used
-        
+
     Raises:
         HTTPException: If any step fails
     """
     try:
-        # Step 1: Get or create session
-        session_id_uuid = None
-        if request.session_id:
-            try:
-                session_id_uuid = UUID(request.session_id)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid session_id format. Must be a valid UUID."
-                )
-        
-        session = chat_history_service.get_or_create_session(
-            session_id=session_id_uuid
-        )
-        
-        logger.info(f"Using session: {session.session_id}")
-        
-        # Step 2: Store user message
-        user_message, _ = chat_history_service.save_message(
-            session_id=session.session_id,
-            role="user",
-            content=request.message,
-            generate_embedding=True
-        )
-        
-        logger.info(f"Stored user message (ID: {user_message.id})")
-        
-        # Step 3: Retrieve relevant context
-        context_messages = chat_history_service.get_relevant_context(
-            session_id=session.session_id,
-            query=request.message,
-            limit=5,
-            exclude_roles=None  # Include all messages in context
-        )
-        
-        logger.info(f"Retrieved {len(context_messages)} context messages")
-        
-        # Step 4: Format context for LLM
-        context_str = None
-        if context_messages:
-            context_str = chat_history_service.format_context_for_llm(
-                context_messages
+        turn = await _prepare_chat_turn(request)
+
+        reply = turn.cached_reply
+
+        if reply is None:
+            # Step 5: Generate response with context
+            reply = await ollama_service.generate_chat_response(
+                user_message=request.message,
+                conversation_history=None,  # We use context instead
+                context=turn.context_str
             )
-        
-        # Step 5: Generate response with context
-        reply = await ollama_service.generate_chat_response(
-            user_message=request.message,
-            conversation_history=None,  # We use context instead
-            context=context_str
-        )
-        
-        logger.info("Generated response from Ollama")
-        
+
+            logger.info("Generated response from Ollama")
+
+            if settings.semantic_cache_enabled:
+                semantic_cache.store(turn.session_id, turn.query_embedding, reply)
+
         # Step 6: Store assistant response
-        assistant_message, _ = chat_history_service.save_message(
-            session_id=session.session_id,
+        assistant_message, _ = await asyncio.to_thread(
+            chat_history_service.save_message,
+            session_id=turn.session.session_id,
             role="assistant",
             content=reply,
-            generate_embedding=True
+            generate_embedding=True,
+            wait_for_index=False  # Not searched again within this request
         )
-        
+
         logger.info(f"Stored assistant message (ID: {assistant_message.id})")
-        
-        # Step 7: Format context for response
-        context_used = None
-        if context_messages:
-            context_used = [
-                ContextMessage(
-                    role=ctx['role'],
-                    content=ctx['content'],
-                    score=ctx['score'],
-                    timestamp=ctx.get('timestamp')
-                )
-                for ctx in context_messages
-            ]
-        
-        # Return response with session info and context
-        return ChatResponse(
-            reply=reply,
-            session_id=str(session.session_id),
-            context_used=context_used
-        )
-        
+
+        # Return response with session info and context (already in the
+        # ChatResponse shape, so it is serialized without re-validation)
+        return ORJSONResponse({
+            "reply": reply,
+            "session_id": turn.session_id,
+            "context_used": turn.context_used(),
+        })
+
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
@@ -130,3 +231,103 @@ async def chat(request: ChatRequest):
             detail=f"Failed to process chat request: {str(e)}"
         )
 
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format a server-sent event frame."""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+async def _store_assistant_reply(turn: _ChatTurn, reply: str):
+    """Persist a streamed reply once the stream has finished."""
+    try:
+        assistant_message, _ = await asyncio.to_thread(
+            chat_history_service.save_message,
+            session_id=turn.session.session_id,
+            role="assistant",
+            content=reply,
+            generate_embedding=True,
+            wait_for_index=False
+        )
+        logger.info(f"Stored assistant message (ID: {assistant_message.id})")
+    except Exception as e:
+        logger.error(f"Failed to store streamed reply: {e}", exc_info=True)
+
+
+@router.post("/chat/stream", tags=["chat"])
+async def chat_stream(request: ChatRequest):
+    """
+    Context-aware chat endpoint that streams the reply as server-sent events.
+
+    Runs the same steps as /chat, but forwards Ollama's tokens as they are
+    generated instead of waiting for the full reply. Events:
+    - ``context``: session_id and context_used, sent first
+    - ``token``: a chunk of the reply (``{"content": "..."}``)
+    - ``done``: the stream finished successfully
+    - ``error``: generation failed (``{"status_code": ..., "detail": ...}``)
+
+    The assistant's reply is stored after the stream completes.
+
+    Args:
+        request: ChatRequest with message and optional session_id
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+
+    Raises:
+        HTTPException: If the request fails before streaming starts
+    """
+    try:
+        turn = await _prepare_chat_turn(request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Chat stream endpoint error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to process chat request: {str(e)}"
+        )
+
+    async def event_stream() -> AsyncIterator[str]:
+        yield _sse("context", {
+            "session_id": turn.session_id,
+            "context_used": turn.context_used(),
+        })
+
+        if turn.cached_reply is not None:
+            reply = turn.cached_reply
+            yield _sse("token", {"content": reply})
+        else:
+            chunks = []
+            try:
+                async for chunk in ollama_service.stream_chat_response(
+                    user_message=request.message,
+                    context=turn.context_str
+                ):
+                    chunks.append(chunk)
+                    yield _sse("token", {"content": chunk})
+            except HTTPException as e:
+                yield _sse("error", {"status_code": e.status_code, "detail": e.detail})
+                return
+
+            reply = "".join(chunks)
+
+            if not reply:
+                yield _sse("error", {
+                    "status_code": 502,
+                    "detail": "Ollama returned empty response"
+                })
+                return
+
+            logger.info("Streamed response from Ollama")
+
+            if settings.semantic_cache_enabled:
+                semantic_cache.store(turn.session_id, turn.query_embedding, reply)
+
+        yield _sse("done", {})
+
+        # Store the reply without holding up the end of the stream
+        task = asyncio.create_task(_store_assistant_reply(turn, reply))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -3,6 +3,7 @@ Health check endpoint - checks all service dependencies
 """
 
 from fastapi import APIRouter
+import asyncio
 import logging
 
 from app.schemas.health import HealthResponse, ServiceHealth
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.get("/health", response_model=HealthResponse, tags=["health"])
-def health_check():
+async def health_check():
     """
     Comprehensive health check for all services.
     
@@ -30,24 +31,30 @@ def health_check():
     Returns:
         HealthResponse with status for each service and overall system status
     """
-    # Track overall health
-    services_healthy = []
-    
-    # 1. Check PostgreSQL
-    postgres_health = _check_postgres()
-    services_healthy.append(postgres_health.status == "healthy")
+    # Run all probes concurrently - each one does blocking I/O, so it is
+    # offloaded to a worker thread to keep the event loop free
+    checks = (
+        ("PostgreSQL", _check_postgres),
+        ("Qdrant", _check_qdrant),
+        ("Ollama", _check_ollama),
+        ("Embedding model", _check_embedding_model),
+    )
     
-    # 2. Check Qdrant
-    qdrant_health = _check_qdrant()
-    services_healthy.append(qdrant_health.status == "healthy")
+    results = await asyncio.gather(
+        *(asyncio.to_thread(check) for _, check in checks),
+        return_exceptions=True
+    )
     
-    # 3. Check Ollama
-    ollama_health = _check_ollama()
-    services_healthy.append(ollama_health.status == "healthy")
+    postgres_health, qdrant_health, ollama_health, embedding_health = [
+        _unhealthy_from_exception(name, result)
+        if isinstance(result, BaseException) else result
+        for (name, _), result in zip(checks, results)
+    ]
     
-    # 4. Check Embedding Model
-    embedding_health = _check_embedding_model()
-    services_healthy.append(embedding_health.status == "healthy")
+    services_healthy = [
+        health.status == "healthy"
+        for health in (postgres_health, qdrant_health, ollama_health, embedding_health)
+    ]
     
     # Determine overall status
     if all(services_healthy):
@@ -69,6 +76,24 @@ def health_check():
     )
 
 
+def _unhealthy_from_exception(name: str, error: BaseException) -> ServiceHealth:
+    """
+    Convert an exception raised by a probe into an unhealthy status.
+    
+    Args:
+        name: Human-readable service name
+        error: Exception raised by the probe
+    
+    Returns:
+        ServiceHealth with unhealthy status
+    """
+    logger.error(f"{name} health check failed: {error}")
+    return ServiceHealth(
+        status="unhealthy",
+        message=f"Error: {str(error)}"
+    )
+
+
 def _check_postgres() -> ServiceHealth:
     """
     Check PostgreSQL database connection.
@@ -114,19 +139,17 @@ def _check_qdrant() -> ServiceHealth:
         ServiceHealth with Qdrant status
     """
     try:
-        is_healthy = qdrant_service.check_health()
+        # Point count comes from the same (TTL-cached) collection fetch
+        points_count = qdrant_service.get_health_points_count()
         
-        if is_healthy:
-            # Get collection info
-            collection_info = qdrant_service.get_collection_info()
-            
+        if points_count is not None:
             return ServiceHealth(
                 status="healthy",
                 message="Collection ready",
                 details={
                     "url": settings.qdrant_url,
                     "collection": settings.qdrant_collection,
-                    "vectors_count": collection_info.get("points_count", 0)
+                    "vectors_count": points_count
                 }
             )
         else:
@@ -195,7 +218,8 @@ def _check_embedding_model() -> ServiceHealth:
                 details={
                     "model": model_info["model_name"],
                     "dimension": model_info["dimension"],
-                    "device": model_info["device"]
+                    "device": model_info["device"],
+                    "cache": model_info["cache"]
                 }
             )
         else:
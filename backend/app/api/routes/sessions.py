@@ -2,9 +2,13 @@
 Session management endpoints - CRUD operations for chat sessions
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from uuid import UUID
-from typing import Optional
+from typing import Optional, Tuple
+from datetime import datetime
+import base64
+import binascii
 import logging
 
 from app.schemas.chat import (
@@ -12,7 +16,6 @@ from app.schemas.chat import (
     SessionResponse,
     SessionListResponse,
     SessionMessagesResponse,
-    MessageResponse,
     SessionStatsResponse,
 )
 from app.services.chat_history_service import chat_history_service
@@ -21,6 +24,42 @@ router = APIRouter(prefix="/sessions", tags=["sessions"])
 logger = logging.getLogger(__name__)
 
 
+def _encode_cursor(updated_at: str, session_id: str) -> str:
+    """
+    Build an opaque, URL-safe page cursor from the last session of a page.
+    
+    Args:
+        updated_at: Session's updated_at (ISO format)
+        session_id: Session UUID
+    
+    Returns:
+        Base64url-encoded cursor
+    """
+    raw = f"{updated_at}|{session_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a page cursor produced by _encode_cursor.
+    
+    Args:
+        cursor: Cursor from a previous response
+    
+    Returns:
+        Tuple of (updated_at, session_id)
+    
+    Raises:
+        HTTPException: 422 if the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        updated_at, session_id = raw.split("|")
+        return datetime.fromisoformat(updated_at), UUID(session_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=422, detail="Invalid pagination cursor")
+
+
 @router.post("", response_model=SessionResponse, status_code=201)
 async def create_session(request: Optional[SessionCreate] = None):
     """
@@ -44,7 +83,9 @@ async def create_session(request: Optional[SessionCreate] = None):
         
         logger.info(f"Created new session: {session.session_id}")
         
-        return SessionResponse(
+        # Responses below are built from our own database rows, so
+        # model_construct skips re-validating trusted data
+        return SessionResponse.model_construct(
             session_id=str(session.session_id),
             user_id=session.user_id,
             created_at=session.created_at.isoformat(),
@@ -63,38 +104,49 @@ async def create_session(request: Optional[SessionCreate] = None):
 @router.get("", response_model=SessionListResponse)
 async def list_sessions(
     user_id: Optional[str] = None,
-    limit: int = 20
+    limit: int = Query(20, ge=1),
+    before: Optional[str] = None
 ):
     """
-    List recent chat sessions.
+    List recent chat sessions, most recently updated first.
+    
+    Results are paginated by cursor: pass the returned next_cursor as
+    ``before`` to fetch the following page.
     
     Args:
         user_id: Optional filter by user ID
         limit: Maximum number of sessions to return (default: 20)
+        before: Opaque cursor (next_cursor of the previous page)
     
     Returns:
-        SessionListResponse with list of sessions
+        SessionListResponse with list of sessions and the next page cursor
     """
+    # Decoded outside the try block so a bad cursor is a 422, not a 500
+    cursor = _decode_cursor(before) if before else None
+    
     try:
+        # Fetch one extra row to know whether another page exists
         sessions_data = chat_history_service.get_recent_sessions(
             user_id=user_id,
-            limit=limit
+            limit=limit + 1,
+            before=cursor
         )
         
-        sessions = [
-            SessionResponse(
-                session_id=s['session_id'],
-                user_id=s.get('user_id'),
-                created_at=s['created_at'],
-                updated_at=s['updated_at'],
-                message_count=s.get('message_count', 0)
-            )
-            for s in sessions_data
-        ]
+        next_cursor = None
+        if len(sessions_data) > limit:
+            sessions_data = sessions_data[:limit]
+            last = sessions_data[-1]
+            next_cursor = _encode_cursor(last['updated_at'], last['session_id'])
         
-        logger.info(f"Retrieved {len(sessions)} sessions")
+        logger.info(f"Retrieved {len(sessions_data)} sessions")
         
-        return SessionListResponse(sessions=sessions)
+        # The service already returns rows in the SessionResponse shape, so
+        # the list is serialized as-is instead of being built into models
+        # and validated again item by item
+        return ORJSONResponse({
+            "sessions": sessions_data,
+            "next_cursor": next_cursor,
+        })
         
     except Exception as e:
         logger.error(f"Failed to list sessions: {e}")
@@ -105,29 +157,21 @@ async def list_sessions(
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: str):
+async def get_session(session_id: UUID):
     """
     Get details for a specific session.
     
     Args:
-        session_id: Session UUID
+        session_id: Session UUID (validated by FastAPI, 422 if malformed)
     
     Returns:
         SessionResponse with session details
     
     Raises:
-        HTTPException: If session not found or invalid UUID
+        HTTPException: If session not found
     """
     try:
-        session_uuid = UUID(session_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid session_id format. Must be a valid UUID."
-        )
-    
-    try:
-        session = chat_history_service.get_session(session_uuid)
+        session = chat_history_service.get_session(session_id)
         
         if not session:
             raise HTTPException(
@@ -136,14 +180,15 @@ async def get_session(session_id: str):
             )
         
         # Get message count
-        messages = chat_history_service.get_session_messages(session_uuid)
+        message_count = chat_history_service.count_session_messages(session_id)
         
-        return SessionResponse(
+        # Trusted database row - skip validation
+        return SessionResponse.model_construct(
             session_id=str(session.session_id),
             user_id=session.user_id,
             created_at=session.created_at.isoformat(),
             updated_at=session.updated_at.isoformat(),
-            message_count=len(messages)
+            message_count=message_count
         )
         
     except HTTPException:
@@ -158,7 +203,7 @@ async def get_session(session_id: str):
 
 @router.get("/{session_id}/messages", response_model=SessionMessagesResponse)
 async def get_session_messages(
-    session_id: str,
+    session_id: UUID,
     limit: Optional[int] = None,
     offset: int = 0
 ):
@@ -166,7 +211,7 @@ async def get_session_messages(
     Get all messages for a specific session.
     
     Args:
-        session_id: Session UUID
+        session_id: Session UUID (validated by FastAPI, 422 if malformed)
         limit: Maximum number of messages to return
         offset: Number of messages to skip
     
@@ -174,19 +219,11 @@ async def get_session_messages(
         SessionMessagesResponse with list of messages
     
     Raises:
-        HTTPException: If session not found or invalid UUID
+        HTTPException: If session not found
     """
-    try:
-        session_uuid = UUID(session_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid session_id format. Must be a valid UUID."
-        )
-    
     try:
         # Verify session exists
-        session = chat_history_service.get_session(session_uuid)
+        session = chat_history_service.get_session(session_id)
         if not session:
             raise HTTPException(
                 status_code=404,
@@ -195,28 +232,31 @@ async def get_session_messages(
         
         # Get messages
         messages = chat_history_service.get_session_messages(
-            session_id=session_uuid,
+            session_id=session_id,
             limit=limit,
             offset=offset
         )
         
+        # Build the SessionMessagesResponse shape directly - rows come from
+        # our own database, so per-message model validation is skipped
+        session_id_str = str(session_id)
         message_responses = [
-            MessageResponse(
-                id=msg.id,
-                session_id=str(msg.session_id),
-                role=msg.role,
-                content=msg.content,
-                timestamp=msg.timestamp.isoformat()
-            )
+            {
+                "id": msg.id,
+                "session_id": session_id_str,
+                "role": msg.role,
+                "content": msg.content,
+                "timestamp": msg.timestamp.isoformat(),
+            }
             for msg in messages
         ]
         
         logger.info(f"Retrieved {len(message_responses)} messages for session {session_id}")
         
-        return SessionMessagesResponse(
-            session_id=session_id,
-            messages=message_responses
-        )
+        return ORJSONResponse({
+            "session_id": session_id_str,
+            "messages": message_responses,
+        })
         
     except HTTPException:
         raise
@@ -229,29 +269,21 @@ async def get_session_messages(
 
 
 @router.get("/{session_id}/stats", response_model=SessionStatsResponse)
-async def get_session_stats(session_id: str):
+async def get_session_stats(session_id: UUID):
     """
     Get statistics for a specific session.
     
     Args:
-        session_id: Session UUID
+        session_id: Session UUID (validated by FastAPI, 422 if malformed)
     
     Returns:
         SessionStatsResponse with session statistics
     
     Raises:
-        HTTPException: If session not found or invalid UUID
+        HTTPException: If session not found
     """
     try:
-        session_uuid = UUID(session_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid session_id format. Must be a valid UUID."
-        )
-    
-    try:
-        stats = chat_history_service.get_session_stats(session_uuid)
+        stats = chat_history_service.get_session_stats(session_id)
         
         if not stats:
             raise HTTPException(
@@ -259,7 +291,8 @@ async def get_session_stats(session_id: str):
                 detail=f"Session {session_id} not found"
             )
         
-        return SessionStatsResponse(**stats)
+        # Stats are computed from our own database - skip validation
+        return SessionStatsResponse.model_construct(**stats)
         
     except HTTPException:
         raise
@@ -272,7 +305,7 @@ async def get_session_stats(session_id: str):
 
 
 @router.delete("/{session_id}", status_code=204)
-async def delete_session(session_id: str):
+async def delete_session(session_id: UUID):
     """
     Delete a session and all its messages.
     
@@ -280,7 +313,7 @@ async def delete_session(session_id: str):
     and remove all associated vectors from Qdrant.
     
     Args:
-        session_id: Session UUID
+        session_id: Session UUID (validated by FastAPI, 422 if malformed)
     
     Returns:
         204 No Content on success
@@ -289,15 +322,7 @@ async def delete_session(session_id: str):
         HTTPException: If session not found or deletion fails
     """
     try:
-        session_uuid = UUID(session_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid session_id format. Must be a valid UUID."
-        )
-    
-    try:
-        success = chat_history_service.delete_session(session_uuid)
+        success = chat_history_service.delete_session(session_id)
         
         if not success:
             raise HTTPException(
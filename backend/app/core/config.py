@@ -3,33 +3,49 @@ Configuration module for the chatbot application.
 Loads environment variables and provides application settings.
 """
 
-import os
+from functools import lru_cache
 from typing import List
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables"""
+    """
+    Application settings loaded from environment variables.
+    
+    Each field is read from the upper-cased environment variable of the
+    same name (e.g. ``postgres_host`` <- ``POSTGRES_HOST``) or from ``.env``.
+    """
     
     # Application settings
     app_name: str = "Chatbot API"
     app_version: str = "1.0.0"
     
     # Debug settings
-    debug_sql: bool = os.getenv("DEBUG_SQL", "false").lower() == "true"
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    debug_sql: bool = False
+    log_level: str = "INFO"
     
     # Ollama configuration
-    ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://host.docker.internal:11434")
-    ollama_model: str = os.getenv("OLLAMA_MODEL", "llama3")
+    ollama_base_url: str = "http://host.docker.internal:11434"
+    ollama_model: str = "llama3"
     ollama_timeout: float = 60.0
+    ollama_max_connections: int = 100
+    ollama_max_keepalive_connections: int = 50
     
     # PostgreSQL configuration
-    postgres_host: str = os.getenv("POSTGRES_HOST", "postgres")
-    postgres_port: int = int(os.getenv("POSTGRES_PORT", "5432"))
-    postgres_db: str = os.getenv("POSTGRES_DB", "chatbot")
-    postgres_user: str = os.getenv("POSTGRES_USER", "chatbot_user")
-    postgres_password: str = os.getenv("POSTGRES_PASSWORD", "chatbot_password")
+    postgres_host: str = "postgres"
+    postgres_port: int = 5432
+    postgres_db: str = "chatbot"
+    postgres_user: str = "chatbot_user"
+    postgres_password: str = "chatbot_password"
+    
+    # PostgreSQL connection pool
+    postgres_pool_size: int = 10
+    postgres_max_overflow: int = 10
+    postgres_pool_timeout: float = 10.0
+    postgres_pool_recycle: int = 1800  # Seconds before a connection is replaced
+    
+    # Server processes sharing the database (set by the container command)
+    uvicorn_workers: int = 1
     
     @property
     def database_url(self) -> str:
@@ -45,10 +61,20 @@ class Settings(BaseSettings):
         )
     
     # Qdrant configuration
-    qdrant_host: str = os.getenv("QDRANT_HOST", "qdrant")
-    qdrant_port: int = int(os.getenv("QDRANT_PORT", "6333"))
-    qdrant_collection: str = os.getenv("QDRANT_COLLECTION", "chat_history")
-    qdrant_grpc_port: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    qdrant_host: str = "qdrant"
+    qdrant_port: int = 6333
+    qdrant_collection: str = "chat_history"
+    qdrant_grpc_port: int = 6334
+    qdrant_prefer_grpc: bool = True
+    qdrant_max_connections: int = 32  # REST connection pool (when gRPC is off)
+    qdrant_quantization: str = "scalar"  # 'scalar' (int8), 'binary' or 'none'
+    qdrant_rescore: bool = True
+    qdrant_oversampling: float = 2.0
+    qdrant_hnsw_ef: int = 64
+    qdrant_write_batch_size: int = 32
+    qdrant_write_max_wait_ms: float = 50.0
+    qdrant_upload_batch_size: int = 256  # Bulk saves this large use upload_collection
+    qdrant_upload_parallel: int = 8  # Capped at the CPU count
     
     @property
     def qdrant_url(self) -> str:
@@ -61,19 +87,46 @@ class Settings(BaseSettings):
         return f"http://{self.qdrant_host}:{self.qdrant_port}"
     
     # Embedding model configuration
-    embedding_model: str = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-    embedding_dim: int = int(os.getenv("EMBEDDING_DIM", "384"))
-    embedding_device: str = os.getenv("EMBEDDING_DEVICE", "cpu")  # 'cpu' or 'cuda'
-    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_dim: int = 384
+    embedding_device: str = "auto"  # 'auto', 'cpu' or 'cuda'
+    embedding_dtype: str = "auto"  # CUDA weights: 'auto', 'bf16', 'fp16' or 'fp32'
+    embedding_backend: str = "torch"  # 'torch', 'onnx-int8' (CPU) or 'model2vec'
+    embedding_onnx_dir: str = ".onnx_models"
+    embedding_compile: bool = False  # torch.compile the model (torch backend)
+    embedding_batch_size: int = 32
+    embedding_batch_max_wait_ms: float = 10.0
+    embedding_cache_size: int = 1024  # 0 disables the embedding cache
+    embedding_cache_max_chars: int = 512
     
     # Context retrieval configuration
-    retrieval_top_k: int = int(os.getenv("RETRIEVAL_TOP_K", "5"))
-    retrieval_score_threshold: float = float(os.getenv("RETRIEVAL_SCORE_THRESHOLD", "0.5"))
-    retrieval_max_context_length: int = int(os.getenv("RETRIEVAL_MAX_CONTEXT_LENGTH", "2000"))
-    
+    retrieval_top_k: int = 5
+    retrieval_score_threshold: float = 0.5
+    retrieval_max_context_length: int = 2000
+
+    # Semantic cache configuration
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.92
+    semantic_cache_max_entries: int = 256
+    semantic_cache_max_sessions: int = 1024
+
+    # Context cache configuration
+    context_cache_enabled: bool = True
+    context_cache_threshold: float = 0.86
+    context_cache_ttl_seconds: float = 60.0
+    context_cache_max_sessions: int = 1024
+
+    # Session cache configuration
+    session_cache_enabled: bool = True
+    session_cache_ttl_seconds: float = 300.0
+    session_cache_max_sessions: int = 10000
+
+    # Health check configuration
+    health_cache_ttl_seconds: float = 5.0  # 0 checks dependencies on every probe
+
     # Session configuration
-    session_timeout_hours: int = int(os.getenv("SESSION_TIMEOUT_HOURS", "24"))
-    max_messages_per_session: int = int(os.getenv("MAX_MESSAGES_PER_SESSION", "1000"))
+    session_timeout_hours: int = 24
+    max_messages_per_session: int = 1000
     
     # CORS settings
     cors_origins: List[str] = [
@@ -83,9 +136,11 @@ class Settings(BaseSettings):
         "http://localhost:80"
     ]
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
+        frozen=True
+    )
     
     def get_config_summary(self) -> dict:
         """
@@ -110,6 +165,17 @@ class Settings(BaseSettings):
         }
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsing the environment only once.
+    
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
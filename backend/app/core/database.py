@@ -4,12 +4,13 @@ Database connection and session management.
 Handles PostgreSQL connections via SQLAlchemy and Qdrant initialization.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
 from typing import Generator
 import logging
+import threading
 
 from app.core.config import settings
 from app.models.chat_models import Base
@@ -26,41 +27,92 @@ class DatabaseManager:
         self.engine = None
         self.SessionLocal = None
         self._initialized = False
+        self._lock = threading.Lock()
     
     def initialize(self):
         """
         Initialize the database engine and create tables.
-        """
-        if self._initialized:
-            logger.info("Database already initialized")
-            return
         
-        try:
-            # Create database engine
-            self.engine = create_engine(
-                settings.database_url,
-                pool_pre_ping=True,  # Verify connections before using
-                pool_size=5,
-                max_overflow=10,
-                echo=settings.debug_sql  # Log SQL queries if debug enabled
-            )
+        Safe to call from several threads - only the first call creates
+        the engine.
+        """
+        with self._lock:
+            if self._initialized:
+                logger.info("Database already initialized")
+                return
             
-            # Create session factory
-            self.SessionLocal = sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self.engine
-            )
+            try:
+                # Create database engine
+                self.engine = create_engine(
+                    settings.database_url,
+                    pool_pre_ping=True,  # Verify connections before using
+                    pool_size=settings.postgres_pool_size,
+                    max_overflow=settings.postgres_max_overflow,
+                    pool_timeout=settings.postgres_pool_timeout,
+                    pool_recycle=settings.postgres_pool_recycle,  # Replace long-lived connections
+                    echo=settings.debug_sql  # Log SQL queries if debug enabled
+                )
+            
+                # Create session factory
+                self.SessionLocal = sessionmaker(
+                    autocommit=False,
+                    autoflush=False,
+                    bind=self.engine
+                )
             
-            # Create all tables
-            Base.metadata.create_all(bind=self.engine)
+                # Create all tables
+                Base.metadata.create_all(bind=self.engine)
             
-            self._initialized = True
-            logger.info("Database initialized successfully")
+                self._check_pool_budget()
             
+                self._initialized = True
+                logger.info("Database initialized successfully")
+            
+            except Exception as e:
+                logger.error(f"Failed to initialize database: {e}")
+                raise
+    
+    def _check_pool_budget(self):
+        """
+        Warn if the pools of all workers could exceed PostgreSQL's
+        max_connections, which shows up as connection errors under load.
+        """
+        try:
+            with self.engine.connect() as conn:
+                max_connections = int(conn.execute(text("SHOW max_connections")).scalar())
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
-            raise
+            logger.warning(f"Could not read max_connections: {e}")
+            return
+        
+        workers = max(settings.uvicorn_workers, 1)
+        per_worker = settings.postgres_pool_size + settings.postgres_max_overflow
+        total = per_worker * workers
+        budget = max_connections // workers
+        
+        if total > max_connections:
+            logger.warning(
+                f"Connection pool allows {total} connections ({per_worker} per "
+                f"worker x {workers} workers), but PostgreSQL max_connections is "
+                f"{max_connections}. Lower POSTGRES_POOL_SIZE + "
+                f"POSTGRES_MAX_OVERFLOW to at most {budget}."
+            )
+    
+    def is_initialized(self) -> bool:
+        """
+        Check if initialize() has completed.
+        
+        Returns:
+            True if the engine is ready and tables exist
+        """
+        return self._initialized
+    
+    def _require_initialized(self):
+        """
+        Raise if initialize() hasn't run - initialization belongs to
+        application startup (init_db), not to the request path.
+        """
+        if not self._initialized:
+            raise RuntimeError("Database not initialized; call init_db() at startup")
     
     def get_session(self) -> Session:
         """
@@ -68,9 +120,11 @@ class DatabaseManager:
         
         Returns:
             SQLAlchemy Session instance
+        
+        Raises:
+            RuntimeError: If the database hasn't been initialized
         """
-        if not self._initialized:
-            self.initialize()
+        self._require_initialized()
         
         return self.SessionLocal()
     
@@ -79,6 +133,9 @@ class DatabaseManager:
         """
         Provide a transactional scope for database operations.
         
+        The transaction is committed when the block exits (rolled back on
+        error) and the session is closed - don't call commit() inside it.
+        
         Usage:
             with db_manager.session_scope() as session:
                 session.query(ChatSession).all()
@@ -86,15 +143,10 @@ class DatabaseManager:
         Yields:
             SQLAlchemy Session instance
         """
-        session = self.get_session()
-        try:
+        self._require_initialized()
+        
+        with self.SessionLocal.begin() as session:
             yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-        finally:
-            session.close()
     
     def close(self):
         """
@@ -146,17 +198,22 @@ def check_db_health() -> bool:
     """
     Check if database connection is healthy.
     
+    Pings over a pooled connection without opening a session or
+    transaction. Does not initialize the database - returns False if
+    init_db() hasn't run yet.
+    
     Returns:
         True if database is accessible, False otherwise
     """
+    if not db_manager._initialized:
+        logger.error("Database health check failed: database not initialized")
+        return False
+    
     try:
-        from sqlalchemy import text
-        
-        with db_manager.session_scope() as session:
-            # Simple query to check connection
-            session.execute(text("SELECT 1"))
+        with db_manager.engine.connect() as conn:
+            # Sent as-is, skipping SQLAlchemy statement compilation
+            conn.exec_driver_sql("SELECT 1")
         return True
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return False
-
@@ -5,13 +5,30 @@ Run this to verify all configuration settings and test connections
 to external services (PostgreSQL, Qdrant, Ollama).
 """
 
+import atexit
 import sys
 import logging
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
+
+import httpx
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shared client so repeated checks reuse pooled connections
+_HTTP = httpx.Client(
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+)
+atexit.register(_HTTP.close)
+
+_RULE = "-" * 60
+
+
+def _section(title: str, lines: List[str]):
+    """Log a section header and its lines as a single record."""
+    logger.info("\n%s\n%s:\n%s\n%s", _RULE, title, _RULE, "\n".join(lines))
+
 
 def validate_config() -> Dict[str, Tuple[bool, str]]:
     """
@@ -25,9 +42,7 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 1. Load Configuration
     # ========================================
-    logger.info("=" * 60)
-    logger.info("CONFIGURATION VALIDATION")
-    logger.info("=" * 60)
+    logger.info("%s\nCONFIGURATION VALIDATION\n%s", "=" * 60, "=" * 60)
     
     try:
         from app.core.config import settings
@@ -41,28 +56,26 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 2. Display Configuration
     # ========================================
-    logger.info("\n" + "-" * 60)
-    logger.info("Configuration Summary:")
-    logger.info("-" * 60)
-    
     config_summary = settings.get_config_summary()
-    for key, value in config_summary.items():
-        logger.info(f"  {key:25s}: {value}")
+    _section("Configuration Summary", [
+        f"  {key:25s}: {value}" for key, value in config_summary.items()
+    ])
     
     # ========================================
     # 3. Validate PostgreSQL Configuration
     # ========================================
-    logger.info("\n" + "-" * 60)
-    logger.info("PostgreSQL Configuration:")
-    logger.info("-" * 60)
-    logger.info(f"  Host: {settings.postgres_host}")
-    logger.info(f"  Port: {settings.postgres_port}")
-    logger.info(f"  Database: {settings.postgres_db}")
-    logger.info(f"  User: {settings.postgres_user}")
-    logger.info(f"  URL: {settings.database_url.split('@')[1]}")  # Hide password
+    _section("PostgreSQL Configuration", [
+        f"  Host: {settings.postgres_host}",
+        f"  Port: {settings.postgres_port}",
+        f"  Database: {settings.postgres_db}",
+        f"  User: {settings.postgres_user}",
+        f"  URL: {settings.database_url.split('@')[1]}",  # Hide password
+    ])
     
     try:
-        from app.core.database import check_db_health
+        from app.core.database import init_db, check_db_health
+        
+        init_db()
         
         if check_db_health():
             results["postgresql"] = (True, "PostgreSQL connection successful")
@@ -77,18 +90,15 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 4. Validate Qdrant Configuration
     # ========================================
-    logger.info("\n" + "-" * 60)
-    logger.info("Qdrant Configuration:")
-    logger.info("-" * 60)
-    logger.info(f"  Host: {settings.qdrant_host}")
-    logger.info(f"  Port: {settings.qdrant_port}")
-    logger.info(f"  Collection: {settings.qdrant_collection}")
-    logger.info(f"  URL: {settings.qdrant_url}")
+    _section("Qdrant Configuration", [
+        f"  Host: {settings.qdrant_host}",
+        f"  Port: {settings.qdrant_port}",
+        f"  Collection: {settings.qdrant_collection}",
+        f"  URL: {settings.qdrant_url}",
+    ])
     
     try:
-        import httpx
-        
-        response = httpx.get(f"{settings.qdrant_url}/healthz", timeout=5.0)
+        response = _HTTP.get(f"{settings.qdrant_url}/healthz")
         if response.status_code == 200:
             results["qdrant"] = (True, "Qdrant connection successful")
             logger.info("✅ Qdrant connection successful")
@@ -102,31 +112,35 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 5. Validate Embedding Configuration
     # ========================================
-    logger.info("\n" + "-" * 60)
-    logger.info("Embedding Configuration:")
-    logger.info("-" * 60)
-    logger.info(f"  Model: {settings.embedding_model}")
-    logger.info(f"  Dimensions: {settings.embedding_dim}")
-    logger.info(f"  Device: {settings.embedding_device}")
-    logger.info(f"  Batch Size: {settings.embedding_batch_size}")
+    _section("Embedding Configuration", [
+        f"  Model: {settings.embedding_model}",
+        f"  Dimensions: {settings.embedding_dim}",
+        f"  Device: {settings.embedding_device}",
+        f"  Batch Size: {settings.embedding_batch_size}",
+        "  Testing model load (this may take a moment)...",
+    ])
     
     try:
-        logger.info("  Testing model load (this may take a moment)...")
-        from sentence_transformers import SentenceTransformer
+        from app.services.embedding_service import get_model
         
-        model = SentenceTransformer(settings.embedding_model, device=settings.embedding_device)
+        model = get_model()
         
         # Test embedding generation
         test_text = "This is a test sentence."
-        embedding = model.encode(test_text)
+        embedding = model.encode(
+            test_text,
+            convert_to_numpy=True,
+            normalize_embeddings=False,
+            show_progress_bar=False
+        )
+        dim = embedding.shape[0]
         
-        if len(embedding) == settings.embedding_dim:
-            results["embedding"] = (True, f"Embedding model loaded ({len(embedding)} dims)")
-            logger.info(f"✅ Embedding model loaded successfully")
-            logger.info(f"   Generated {len(embedding)}-dimensional embedding")
+        if dim == settings.embedding_dim:
+            results["embedding"] = (True, f"Embedding model loaded ({dim} dims)")
+            logger.info("✅ Embedding model loaded successfully\n   Generated %d-dimensional embedding", dim)
         else:
-            results["embedding"] = (False, f"Dimension mismatch: got {len(embedding)}, expected {settings.embedding_dim}")
-            logger.error(f"❌ Dimension mismatch: got {len(embedding)}, expected {settings.embedding_dim}")
+            results["embedding"] = (False, f"Dimension mismatch: got {dim}, expected {settings.embedding_dim}")
+            logger.error(f"❌ Dimension mismatch: got {dim}, expected {settings.embedding_dim}")
     except Exception as e:
         results["embedding"] = (False, f"Embedding model error: {e}")
         logger.error(f"❌ Embedding model error: {e}")
@@ -134,12 +148,11 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 6. Validate Retrieval Configuration
     # ========================================
-    logger.info("\n" + "-" * 60)
-    logger.info("Retrieval Configuration:")
-    logger.info("-" * 60)
-    logger.info(f"  Top K: {settings.retrieval_top_k}")
-    logger.info(f"  Score Threshold: {settings.retrieval_score_threshold}")
-    logger.info(f"  Max Context Length: {settings.retrieval_max_context_length}")
+    _section("Retrieval Configuration", [
+        f"  Top K: {settings.retrieval_top_k}",
+        f"  Score Threshold: {settings.retrieval_score_threshold}",
+        f"  Max Context Length: {settings.retrieval_max_context_length}",
+    ])
     
     if 0.0 <= settings.retrieval_score_threshold <= 1.0:
         results["retrieval"] = (True, "Retrieval configuration valid")
@@ -151,17 +164,14 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 7. Validate Ollama Configuration (Optional)
     # ========================================
-    logger.info("\n" + "-" * 60)
-    logger.info("Ollama Configuration:")
-    logger.info("-" * 60)
-    logger.info(f"  URL: {settings.ollama_base_url}")
-    logger.info(f"  Model: {settings.ollama_model}")
-    logger.info(f"  Timeout: {settings.ollama_timeout}s")
+    _section("Ollama Configuration", [
+        f"  URL: {settings.ollama_base_url}",
+        f"  Model: {settings.ollama_model}",
+        f"  Timeout: {settings.ollama_timeout}s",
+    ])
     
     try:
-        import httpx
-        
-        response = httpx.get(f"{settings.ollama_base_url}/api/tags", timeout=5.0)
+        response = _HTTP.get(f"{settings.ollama_base_url}/api/tags")
         if response.status_code == 200:
             results["ollama"] = (True, "Ollama connection successful")
             logger.info("✅ Ollama connection successful")
@@ -175,20 +185,18 @@ def validate_config() -> Dict[str, Tuple[bool, str]]:
     # ========================================
     # 8. Summary
     # ========================================
-    logger.info("\n" + "=" * 60)
-    logger.info("VALIDATION SUMMARY")
-    logger.info("=" * 60)
-    
     passed = sum(1 for success, _ in results.values() if success)
     total = len(results)
     
-    for component, (success, message) in results.items():
-        status = "✅ PASS" if success else "❌ FAIL"
-        logger.info(f"{status} - {component:20s}: {message}")
+    summary = [
+        f"{'✅ PASS' if success else '❌ FAIL'} - {component:20s}: {message}"
+        for component, (success, message) in results.items()
+    ]
     
-    logger.info("=" * 60)
-    logger.info(f"Results: {passed}/{total} checks passed")
-    logger.info("=" * 60)
+    logger.info(
+        "\n%s\nVALIDATION SUMMARY\n%s\n%s\n%s\nResults: %d/%d checks passed\n%s",
+        "=" * 60, "=" * 60, "\n".join(summary), "=" * 60, passed, total, "=" * 60
+    )
     
     return results
 
@@ -2,19 +2,81 @@
 Main FastAPI application entry point
 """
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.api.routes import health, chat, sessions
-from app.core.database import init_db
+from app.core.database import init_db, check_db_health, db_manager
+from app.services.ollama_service import ollama_service
+from app.services.qdrant_service import qdrant_service
+from app.services.embedding_batcher import embedding_batcher
+from app.services.qdrant_write_buffer import qdrant_write_buffer
+
+logger = logging.getLogger(__name__)
+
+
+def _init_and_ping_db():
+    """Create tables and check out a pooled connection."""
+    init_db()
+    check_db_health()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan - warm up dependencies before serving requests.
+    
+    Runs in parallel so the first request doesn't pay for them:
+    - Database initialization and a first pooled connection
+    - Embedding model load and one encode (through the batcher)
+    - Qdrant and Ollama connections
+    
+    Warmup failures are logged and don't prevent startup - except a failed
+    database initialization, which aborts it: no request can run without
+    the database and nothing retries the initialization, so the process
+    exits and is restarted (restart: unless-stopped in docker-compose).
+    """
+    warmups = (
+        ("Database", asyncio.to_thread(_init_and_ping_db)),
+        ("Embedding model", embedding_batcher.embed_async("warmup")),
+        ("Qdrant", asyncio.to_thread(qdrant_service.check_health)),
+        ("Ollama", ollama_service.check_health()),
+    )
+    
+    results = await asyncio.gather(
+        *(warmup for _, warmup in warmups),
+        return_exceptions=True
+    )
+    
+    for (name, _), result in zip(warmups, results):
+        if isinstance(result, Exception):
+            logger.warning(f"{name} warmup failed: {result}")
+    
+    if not db_manager.is_initialized():
+        raise RuntimeError("Database initialization failed; aborting startup")
+    
+    yield
+    
+    # Send buffered vector writes, then release pooled connections
+    await asyncio.to_thread(qdrant_write_buffer.flush)
+    await qdrant_service.aclose()
+    await ollama_service.close()
+    db_manager.close()
 
 
 # Initialize FastAPI application
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
-    description="A context-aware chatbot API powered by Ollama, Qdrant, and PostgreSQL"
+    description="A context-aware chatbot API powered by Ollama, Qdrant, and PostgreSQL",
+    default_response_class=ORJSONResponse,  # Faster JSON encoding than stdlib json
+    lifespan=lifespan
 )
 
 # Configure CORS middleware
@@ -27,16 +89,6 @@ app.add_middleware(
 )
 
 
-# Startup event - initialize database
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup"""
-    try:
-        init_db()
-    except Exception as e:
-        print(f"Warning: Database initialization failed: {e}")
-
-
 # Include routers
 app.include_router(health.router)
 app.include_router(chat.router)
@@ -4,8 +4,7 @@ Database models for chat sessions and messages.
 These models use SQLAlchemy ORM for PostgreSQL storage.
 """
 
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Integer, Index, func
 from sqlalchemy.orm import relationship, declarative_base
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -22,6 +21,9 @@ class ChatSession(Base):
     """
     __tablename__ = "chat_sessions"
     
+    # Fetch server-generated timestamps with RETURNING on insert
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Primary key - UUID for distributed systems
     session_id = Column(
         UUID(as_uuid=True),
@@ -34,21 +36,30 @@ class ChatSession(Base):
     # User identifier (for future multi-user support)
     user_id = Column(String(255), nullable=True, index=True)
     
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+    # Timestamps (generated by PostgreSQL). default= renders now() into the
+    # INSERT so tables created before the server defaults existed still work
+    created_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
         nullable=False
     )
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True  # Recent-sessions listing orders and pages by this column
+    )
     
     # Relationship to messages
     messages = relationship(
         "ChatMessage",
         back_populates="session",
         cascade="all, delete-orphan",
-        order_by="ChatMessage.timestamp"
+        # Rows saved in one transaction share a timestamp; id keeps their order
+        order_by="[ChatMessage.timestamp, ChatMessage.id]"
     )
     
     def __repr__(self):
@@ -64,6 +75,9 @@ class ChatMessage(Base):
     """
     __tablename__ = "chat_messages"
     
+    # Fetch server-generated id and timestamp with RETURNING on insert
+    __mapper_args__ = {"eager_defaults": True}
+    
     # Primary key - auto-incrementing integer
     id = Column(Integer, primary_key=True, autoincrement=True)
     
@@ -71,14 +85,20 @@ class ChatMessage(Base):
     session_id = Column(
         UUID(as_uuid=True),
         ForeignKey("chat_sessions.session_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
+        # No single-column index - ix_chat_messages_session_ts leads with
+        # session_id and also serves the foreign key (cascading deletes)
     )
     
     # Message metadata
     role = Column(String(50), nullable=False)  # 'user' or 'assistant'
     content = Column(Text, nullable=False)
-    timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    timestamp = Column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        nullable=False
+    )
     
     # Reference to Qdrant vector storage
     # This is the point ID in Qdrant collection
@@ -87,6 +107,18 @@ class ChatMessage(Base):
     # Relationship to session
     session = relationship("ChatSession", back_populates="messages")
     
+    # Session history is always read by session, ordered by time. role and
+    # vector_id are included so metadata-only queries (counts, stats) can be
+    # answered from the index without reading the (TOASTed) content
+    __table_args__ = (
+        Index(
+            "ix_chat_messages_session_ts",
+            session_id,
+            timestamp.desc(),
+            postgresql_include=["role", "vector_id"]
+        ),
+    )
+    
     def __repr__(self):
         return f"<ChatMessage(id={self.id}, session_id={self.session_id}, role={self.role})>"
     
@@ -4,9 +4,13 @@ Qdrant vector database schema definition.
 Defines the structure for storing chat message embeddings in Qdrant.
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
 from datetime import datetime
 
+import numpy as np
+from qdrant_client.http.models import Batch, FieldCondition, MatchAny, MatchValue
+
 
 class QdrantChatSchema:
     """
@@ -56,6 +60,90 @@ class QdrantChatSchema:
             "timestamp_unix": int(timestamp.timestamp()),
         }
     
+    @staticmethod
+    def create_point_payloads(
+        session_id: str,
+        rows: Iterable[Tuple[int, str, str, datetime]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Create payloads for several messages of the same session.
+        
+        Args:
+            session_id: UUID of the chat session
+            rows: (message_id, role, content, timestamp) tuples
+        
+        Returns:
+            List of payload dictionaries in the same order as rows
+        """
+        sid = str(session_id)
+        
+        return [
+            {
+                "session_id": sid,
+                "message_id": message_id,
+                "role": role,
+                "content": content,
+                "timestamp": timestamp.isoformat(),
+                "timestamp_unix": int(timestamp.timestamp()),
+            }
+            for message_id, role, content, timestamp in rows
+        ]
+    
+    @staticmethod
+    def build_batch(
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        payloads: List[Dict[str, Any]]
+    ) -> Batch:
+        """
+        Create a columnar batch of points for a single upsert.
+        
+        The client's Batch model only accepts nested lists, so the float32
+        matrix is converted in one ``tolist()`` call at this boundary. The
+        inputs are built by the service, so the batch is constructed
+        without re-validating every float (the gRPC transport converts it
+        straight into protobuf points).
+        
+        Args:
+            ids: Point IDs
+            vectors: (N, VECTOR_DIM) array of embeddings
+            payloads: Payload per point, in the same order as ids
+        
+        Returns:
+            Batch ready to pass as ``points`` to upsert
+        """
+        return Batch.model_construct(
+            ids=list(ids),
+            vectors=vectors.astype(np.float32, copy=False).tolist(),
+            payloads=payloads
+        )
+    
+    @staticmethod
+    def session_condition(session_id: str) -> FieldCondition:
+        """
+        Create a filter condition matching one session's points.
+        
+        Args:
+            session_id: UUID of the chat session
+        
+        Returns:
+            FieldCondition on the indexed session_id field
+        """
+        return FieldCondition(key="session_id", match=MatchValue(value=str(session_id)))
+    
+    @staticmethod
+    def roles_condition(roles: Sequence[str]) -> FieldCondition:
+        """
+        Create a filter condition matching any of the given roles.
+        
+        Args:
+            roles: Roles to match (e.g. for a must_not exclusion)
+        
+        Returns:
+            FieldCondition on the indexed role field
+        """
+        return FieldCondition(key="role", match=MatchAny(any=list(roles)))
+    
     @staticmethod
     def get_collection_config() -> Dict[str, Any]:
         """
@@ -69,6 +157,7 @@ class QdrantChatSchema:
             "vector_size": QdrantChatSchema.VECTOR_DIM,
             "distance": QdrantChatSchema.DISTANCE_METRIC,
             "on_disk_payload": True,  # Store payload on disk for memory efficiency
+            "hnsw_config": QdrantChatSchema.get_index_config(),
         }
     
     @staticmethod
@@ -81,13 +170,14 @@ class QdrantChatSchema:
         """
         return {
             "m": 16,  # Number of edges per node (higher = better quality, more memory)
-            "ef_construct": 100,  # Quality of index construction (higher = better index)
+            "ef_construct": 128,  # Quality of index construction (higher = better index)
+            "payload_m": 16,  # Extra per-session links so session-filtered searches stay on the graph
             "full_scan_threshold": 10000,  # Use full scan for small collections
         }
 
 
-# Qdrant payload field descriptions for documentation
-PAYLOAD_FIELDS = {
+# Qdrant payload field descriptions for documentation (read-only)
+PAYLOAD_FIELDS = MappingProxyType({
     "session_id": {
         "type": "string",
         "indexed": True,
@@ -118,5 +208,4 @@ PAYLOAD_FIELDS = {
         "indexed": True,
         "description": "Unix timestamp for efficient time-based filtering"
     }
-}
-
+})
@@ -3,6 +3,7 @@ Schemas module - Pydantic models for request/response validation
 """
 
 from app.schemas.chat import (
+    MessageRole,
     Message,
     ContextMessage,
     ChatRequest,
@@ -17,6 +18,7 @@ from app.schemas.chat import (
 
 __all__ = [
     # Chat schemas
+    "MessageRole",
     "Message",
     "ContextMessage",
     "ChatRequest",
@@ -2,39 +2,45 @@
 Chat schema definitions for request/response models
 """
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from uuid import UUID
 
 
+# Roles a stored or retrieved message can have
+MessageRole = Literal["user", "assistant"]
+
+
 class Message(BaseModel):
     """Single message in conversation"""
     
-    role: str = Field(..., description="Role of the message sender (user or assistant)")
+    role: MessageRole = Field(..., description="Role of the message sender (user or assistant)")
     content: str = Field(..., description="Content of the message")
     timestamp: Optional[str] = Field(None, description="Message timestamp (ISO format)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "role": "user",
                 "content": "Hello, how are you?",
                 "timestamp": "2025-10-13T10:30:00"
             }
         }
+    )
 
 
 class ContextMessage(BaseModel):
     """Context message with relevance score"""
     
-    role: str = Field(..., description="Role of the message sender")
+    role: MessageRole = Field(..., description="Role of the message sender")
     content: str = Field(..., description="Message content")
     score: float = Field(..., description="Relevance score (0-1)")
     timestamp: Optional[str] = Field(None, description="Message timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "role": "user",
                 "content": "I have a dog named Max",
@@ -42,13 +48,14 @@ class ContextMessage(BaseModel):
                 "timestamp": "2025-10-13T10:25:00"
             }
         }
+    )
 
 
 class ChatRequest(BaseModel):
     """Request model for chat endpoint"""
     
     message: str = Field(..., min_length=1, description="User's message")
-    session_id: Optional[str] = Field(
+    session_id: Optional[UUID] = Field(
         None,
         description="Session ID (UUID). If not provided, a new session will be created"
     )
@@ -57,13 +64,14 @@ class ChatRequest(BaseModel):
         description="Conversation history (deprecated - sessions are now stored server-side)"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "message": "What's my dog's name?",
                 "session_id": "550e8400-e29b-41d4-a716-446655440000"
             }
         }
+    )
 
 
 class ChatResponse(BaseModel):
@@ -76,8 +84,9 @@ class ChatResponse(BaseModel):
         description="Context messages that were used to generate the response"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "reply": "Your dog's name is Max!",
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -91,6 +100,7 @@ class ChatResponse(BaseModel):
                 ]
             }
         }
+    )
 
 
 class SessionCreate(BaseModel):
@@ -101,12 +111,13 @@ class SessionCreate(BaseModel):
         description="Optional user identifier"
     )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "user_123"
             }
         }
+    )
 
 
 class SessionResponse(BaseModel):
@@ -118,8 +129,9 @@ class SessionResponse(BaseModel):
     updated_at: str = Field(..., description="Last update timestamp (ISO format)")
     message_count: Optional[int] = Field(None, description="Number of messages in session")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "user_id": "user_123",
@@ -128,15 +140,21 @@ class SessionResponse(BaseModel):
                 "message_count": 8
             }
         }
+    )
 
 
 class SessionListResponse(BaseModel):
     """Response model for listing sessions"""
     
     sessions: List[SessionResponse] = Field(..., description="List of sessions")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor - pass as 'before' to fetch the next page (null on the last page)"
+    )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "sessions": [
                     {
@@ -146,9 +164,11 @@ class SessionListResponse(BaseModel):
                         "updated_at": "2025-10-13T10:30:00",
                         "message_count": 8
                     }
-                ]
+                ],
+                "next_cursor": "MjAyNS0xMC0xM1QxMDozMDowMHw1NTBlODQwMC1lMjliLTQxZDQtYTcxNi00NDY2NTU0NDAwMDA"
             }
         }
+    )
 
 
 class MessageResponse(BaseModel):
@@ -156,12 +176,13 @@ class MessageResponse(BaseModel):
     
     id: int = Field(..., description="Message ID")
     session_id: str = Field(..., description="Session UUID")
-    role: str = Field(..., description="Message role (user or assistant)")
+    role: MessageRole = Field(..., description="Message role (user or assistant)")
     content: str = Field(..., description="Message content")
     timestamp: str = Field(..., description="Message timestamp (ISO format)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "id": 123,
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -170,6 +191,7 @@ class MessageResponse(BaseModel):
                 "timestamp": "2025-10-13T10:30:00"
             }
         }
+    )
 
 
 class SessionMessagesResponse(BaseModel):
@@ -178,8 +200,9 @@ class SessionMessagesResponse(BaseModel):
     session_id: str = Field(..., description="Session UUID")
     messages: List[MessageResponse] = Field(..., description="List of messages")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "messages": [
@@ -193,6 +216,7 @@ class SessionMessagesResponse(BaseModel):
                 ]
             }
         }
+    )
 
 
 class SessionStatsResponse(BaseModel):
@@ -207,8 +231,9 @@ class SessionStatsResponse(BaseModel):
     first_message_at: Optional[str] = Field(None, description="First message timestamp")
     last_message_at: Optional[str] = Field(None, description="Last message timestamp")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "session_id": "550e8400-e29b-41d4-a716-446655440000",
                 "created_at": "2025-10-13T10:00:00",
@@ -220,4 +245,5 @@ class SessionStatsResponse(BaseModel):
                 "last_message_at": "2025-10-13T10:35:00"
             }
         }
+    )
 
@@ -2,7 +2,7 @@
 Health check schema definitions
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Optional
 
 
@@ -30,8 +30,9 @@ class HealthResponse(BaseModel):
     ollama: ServiceHealth
     embedding_model: ServiceHealth
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "version": "1.0.0",
@@ -69,4 +70,5 @@ class HealthResponse(BaseModel):
                 }
             }
         }
+    )
 
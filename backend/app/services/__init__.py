@@ -4,7 +4,17 @@ Services module - Business logic layer
 
 from app.services.embedding_service import embedding_service, EmbeddingService
 from app.services.qdrant_service import qdrant_service, QdrantService
-from app.services.chat_history_service import chat_history_service, ChatHistoryService
+from app.services.chat_history_service import (
+    chat_history_service,
+    ChatHistoryService,
+    SessionNotFoundError,
+)
+from app.services.semantic_cache import semantic_cache, SemanticCache
+from app.services.embedding_batcher import embedding_batcher, EmbeddingBatcher
+from app.services.context_cache import context_cache, ContextCentroidCache
+from app.services.session_cache import session_cache, SessionCache
+from app.services.qdrant_write_buffer import qdrant_write_buffer, QdrantWriteBuffer
+from app.services.embedding_cache import embedding_cache, EmbeddingCache
 
 __all__ = [
     "embedding_service",
@@ -13,4 +23,17 @@ __all__ = [
     "QdrantService",
     "chat_history_service",
     "ChatHistoryService",
+    "SessionNotFoundError",
+    "semantic_cache",
+    "SemanticCache",
+    "embedding_batcher",
+    "EmbeddingBatcher",
+    "context_cache",
+    "ContextCentroidCache",
+    "session_cache",
+    "SessionCache",
+    "qdrant_write_buffer",
+    "QdrantWriteBuffer",
+    "embedding_cache",
+    "EmbeddingCache",
 ]
@@ -11,17 +11,39 @@ from datetime import datetime
 from uuid import UUID
 import uuid
 
+import numpy as np
+
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import Row, case, desc, func, insert, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 
 from app.models.chat_models import ChatSession, ChatMessage
 from app.core.database import db_manager
-from app.services.embedding_service import embedding_service
+from app.services.embedding_service import embedding_service, is_blank
+from app.services.embedding_batcher import embedding_batcher
 from app.services.qdrant_service import qdrant_service
+from app.services.qdrant_write_buffer import qdrant_write_buffer
+from app.services.semantic_cache import semantic_cache
+from app.services.context_cache import context_cache
+from app.services.session_cache import session_cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fixed lines wrapped around retrieved context in the LLM prompt
+CONTEXT_HEADER = "Previously discussed (relevant context):\n---\n"
+CONTEXT_FOOTER = "\n---"
+
+# Payload fields fetched for retrieved context (the session is already known)
+CONTEXT_FIELDS = ("message_id", "role", "content", "timestamp")
+
+# PostgreSQL SQLSTATE raised when a message references a missing session
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+class SessionNotFoundError(RuntimeError):
+    """Raised when a message is saved to a session that no longer exists."""
+
 
 class ChatHistoryService:
     """
@@ -49,19 +71,20 @@ class ChatHistoryService:
         """
         try:
             new_session_id = uuid.uuid4()
-            now = datetime.utcnow()
             
             with db_manager.session_scope() as db:
-                # Create new session
+                # Create new session (timestamps are set by PostgreSQL
+                # and returned by the INSERT)
                 session = ChatSession(
                     session_id=new_session_id,
-                    user_id=user_id,
-                    created_at=now,
-                    updated_at=now
+                    user_id=user_id
                 )
                 
                 db.add(session)
-                db.commit()
+                db.flush()
+                
+                created_at = session.created_at
+                updated_at = session.updated_at
                 
                 logger.info(f"Created new session: {new_session_id}")
                 
@@ -69,8 +92,8 @@ class ChatHistoryService:
             return ChatSession(
                 session_id=new_session_id,
                 user_id=user_id,
-                created_at=now,
-                updated_at=now
+                created_at=created_at,
+                updated_at=updated_at
             )
                 
         except Exception as e:
@@ -92,9 +115,7 @@ class ChatHistoryService:
         """
         try:
             with db_manager.session_scope() as db:
-                session = db.query(ChatSession).filter(
-                    ChatSession.session_id == session_id
-                ).first()
+                session = db.get(ChatSession, session_id)
                 
                 if not session:
                     return None
@@ -119,6 +140,9 @@ class ChatHistoryService:
         """
         Get existing session or create a new one.
         
+        Recently seen sessions are served from the process-local session
+        cache without querying PostgreSQL.
+        
         Args:
             session_id: Optional existing session ID
             user_id: Optional user identifier
@@ -127,22 +151,36 @@ class ChatHistoryService:
             ChatSession object
         """
         if session_id:
+            if settings.session_cache_enabled:
+                session = session_cache.get(str(session_id))
+                if session:
+                    return session
+            
             session = self.get_session(session_id)
             if session:
+                if settings.session_cache_enabled:
+                    session_cache.put(session)
                 return session
             
             logger.warning(
                 f"Session {session_id} not found, creating new session"
             )
         
-        return self.create_session(user_id=user_id)
+        session = self.create_session(user_id=user_id)
+        
+        if settings.session_cache_enabled:
+            session_cache.put(session)
+        
+        return session
     
     def save_message(
         self,
         session_id: UUID,
         role: str,
         content: str,
-        generate_embedding: bool = True
+        generate_embedding: bool = True,
+        wait_for_index: bool = True,
+        precomputed_embedding: Optional[np.ndarray] = None
     ) -> Tuple[ChatMessage, Optional[str]]:
         """
         Save a message to both PostgreSQL and Qdrant.
@@ -152,65 +190,99 @@ class ChatHistoryService:
             role: 'user' or 'assistant'
             content: Message text content
             generate_embedding: Whether to generate and store embedding
+            wait_for_index: Whether to wait for Qdrant to index the vector
+                (skip when nothing reads it back within the request - the
+                embedding and write then happen in the background, batched
+                with other requests')
+            precomputed_embedding: Embedding of content, if the caller
+                already has one (skips re-encoding)
         
         Returns:
             Tuple of (ChatMessage object, Qdrant point_id)
         
         Raises:
+            SessionNotFoundError: If the session no longer exists
             RuntimeError: If message save fails
         """
         try:
-            # 1. Save to PostgreSQL first
-            timestamp = datetime.utcnow()
-            message_id = None
+            # Blank content (e.g. a whitespace-only LLM reply) has nothing
+            # to embed - the message is saved without a vector
+            if generate_embedding and precomputed_embedding is None and is_blank(content):
+                logger.warning("Saving message with blank content without an embedding")
+                generate_embedding = False
             
+            # Without wait_for_index the vector is only linked, not read
+            # back, so encoding can happen after the request has returned
+            defer_embedding = (
+                generate_embedding
+                and not wait_for_index
+                and precomputed_embedding is None
+            )
+            
+            # Otherwise generate the embedding before opening the
+            # transaction so the connection isn't held while the model runs
+            embedding = None
+            
+            if generate_embedding and not defer_embedding:
+                try:
+                    # Batched with concurrent requests
+                    embedding = precomputed_embedding
+                    if embedding is None:
+                        embedding = embedding_batcher.embed(content)
+                except Exception as e:
+                    logger.error(f"Failed to generate embedding: {e}")
+                    # Continue without embedding - message is still saved
+            
+            # Pre-assign the Qdrant point ID so the row is inserted already
+            # linked to its vector
+            point_id = None
+            if embedding is not None or defer_embedding:
+                point_id = str(uuid.uuid4())
+            
+            # Insert the message and touch the session in one short
+            # transaction; the vector is written after the commit so a slow
+            # Qdrant call doesn't hold the connection and row locks
             with db_manager.session_scope() as db:
-                message = ChatMessage(
-                    session_id=session_id,
-                    role=role,
-                    content=content,
-                    timestamp=timestamp,
-                    vector_id=None  # Will update after Qdrant storage
-                )
-                
-                db.add(message)
-                db.commit()
-                db.refresh(message)
+                # 1. Save to PostgreSQL - one INSERT ... RETURNING yields the
+                # generated id and timestamp without building an ORM object
+                message_id, timestamp = db.execute(
+                    insert(ChatMessage)
+                    .values(
+                        session_id=session_id,
+                        role=role,
+                        content=content,
+                        vector_id=point_id
+                    )
+                    .returning(ChatMessage.id, ChatMessage.timestamp)
+                ).one()
                 
-                message_id = message.id
+                # 2. Update session timestamp
+                self._update_session_timestamp(db, session_id)
             
             logger.debug(
                 f"Saved message {message_id} to PostgreSQL "
                 f"(session: {session_id})"
             )
             
-            # 2. Generate embedding and store in Qdrant
-            point_id = None
-            
-            if generate_embedding:
+            # 3. Store embedding in Qdrant
+            if point_id is not None:
                 try:
-                    # Generate embedding
-                    embedding = embedding_service.generate_embedding(content)
-                    
-                    # Store in Qdrant
-                    point_id = qdrant_service.store_message(
-                        message_id=message_id,
-                        session_id=str(session_id),
-                        role=role,
-                        content=content,
-                        embedding=embedding,
-                        timestamp=timestamp
-                    )
+                    point = {
+                        "message_id": message_id,
+                        "session_id": str(session_id),
+                        "role": role,
+                        "content": content,
+                        "embedding": embedding,
+                        "timestamp": timestamp,
+                        "point_id": point_id,
+                    }
                     
-                    # Update PostgreSQL with vector_id
-                    with db_manager.session_scope() as db:
-                        msg = db.query(ChatMessage).filter(
-                            ChatMessage.id == message_id
-                        ).first()
-                        
-                        if msg:
-                            msg.vector_id = point_id
-                            db.commit()
+                    if wait_for_index:
+                        qdrant_service.store_messages([point])
+                    else:
+                        # Nothing reads it back soon - embed (if needed)
+                        # and batch it with other requests' writes
+                        qdrant_write_buffer.submit(point)
                     
                     logger.debug(
                         f"Stored message {message_id} embedding in Qdrant "
@@ -221,10 +293,10 @@ class ChatHistoryService:
                     logger.error(
                         f"Failed to store embedding for message {message_id}: {e}"
                     )
-                    # Continue without embedding - message is still saved
-            
-            # 3. Update session timestamp
-            self._update_session_timestamp(session_id)
+                    # Continue without embedding - message is still saved,
+                    # just not linked to a vector
+                    point_id = None
+                    self._unlink_vectors([message_id])
             
             # Create detached message object to return
             detached_message = ChatMessage(
@@ -238,25 +310,218 @@ class ChatHistoryService:
             
             return detached_message, point_id
             
+        except IntegrityError as e:
+            if getattr(e.orig, "pgcode", None) != FOREIGN_KEY_VIOLATION:
+                logger.error(f"Failed to save message: {e}")
+                raise RuntimeError(f"Could not save message: {e}")
+            
+            # The session is gone - e.g. deleted through another worker
+            # while this process still had it cached
+            session_cache.invalidate(str(session_id))
+            logger.warning(f"Session {session_id} no longer exists, message not saved")
+            raise SessionNotFoundError(f"Session {session_id} no longer exists")
+            
         except Exception as e:
             logger.error(f"Failed to save message: {e}")
             raise RuntimeError(f"Could not save message: {e}")
     
+    def _unlink_vectors(self, message_ids: List[int]):
+        """
+        Clear the vector_id of messages whose vectors couldn't be stored.
+        
+        Args:
+            message_ids: Message IDs
+        """
+        try:
+            with db_manager.session_scope() as db:
+                db.execute(
+                    update(ChatMessage)
+                    .where(ChatMessage.id.in_(message_ids))
+                    .values(vector_id=None)
+                )
+        except Exception as e:
+            logger.error(f"Failed to unlink vectors from {len(message_ids)} messages: {e}")
+    
+    def save_messages_bulk(
+        self,
+        session_id: UUID,
+        messages: List[Tuple[str, str]],
+        generate_embedding: bool = True,
+        wait_for_index: bool = True
+    ) -> List[ChatMessage]:
+        """
+        Save several messages of one session in a single pass.
+        
+        All rows are inserted in one flush, all contents are embedded in
+        one batched model call and all vectors are stored in one Qdrant
+        upsert (or a parallel bulk upload for large batches) - much faster than calling save_message per message when
+        importing or replaying history.
+        
+        Args:
+            session_id: Session UUID
+            messages: (role, content) tuples in chronological order
+            generate_embedding: Whether to generate and store embeddings
+            wait_for_index: Whether to wait for Qdrant to index the vectors
+        
+        Returns:
+            List of ChatMessage objects in the same order as messages
+        
+        Raises:
+            ValueError: If any message content is empty
+            RuntimeError: If saving fails
+        """
+        if not messages:
+            return []
+        
+        if any(is_blank(content) for _, content in messages):
+            raise ValueError("Cannot save messages with empty content")
+        
+        try:
+            # Embed everything before opening the transaction
+            embeddings = None
+            
+            if generate_embedding:
+                try:
+                    embeddings = embedding_service.generate_embeddings_batch(
+                        [content for _, content in messages]
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to generate batch embeddings: {e}")
+                    # Continue without embeddings - messages are still saved
+            
+            # Pre-assign point IDs so rows are inserted already linked
+            point_ids = None
+            if embeddings is not None:
+                point_ids = [str(uuid.uuid4()) for _ in messages]
+            
+            # Insert the rows and touch the session in one short
+            # transaction; vectors are written after the commit so a slow
+            # upload doesn't hold the connection and row locks
+            with db_manager.session_scope() as db:
+                rows = [
+                    ChatMessage(
+                        session_id=session_id,
+                        role=role,
+                        content=content,
+                        vector_id=point_ids[i] if point_ids else None
+                    )
+                    for i, (role, content) in enumerate(messages)
+                ]
+                
+                # One flush inserts all rows (ids/timestamps via RETURNING)
+                db.add_all(rows)
+                db.flush()
+                
+                self._update_session_timestamp(db, session_id)
+                
+                detached_messages = [
+                    ChatMessage(
+                        id=row.id,
+                        session_id=session_id,
+                        role=row.role,
+                        content=row.content,
+                        timestamp=row.timestamp,
+                        vector_id=row.vector_id
+                    )
+                    for row in rows
+                ]
+            
+            if point_ids is not None:
+                session_id_str = str(session_id)
+                try:
+                    points = [
+                        {
+                            "message_id": message.id,
+                            "session_id": session_id_str,
+                            "role": message.role,
+                            "content": message.content,
+                            "embedding": embedding,
+                            "timestamp": message.timestamp,
+                            "point_id": message.vector_id,
+                        }
+                        for message, embedding in zip(detached_messages, embeddings)
+                    ]
+                    
+                    # Large imports go through the parallel uploader
+                    if len(points) > settings.qdrant_upload_batch_size:
+                        qdrant_service.upload_messages(points, wait=wait_for_index)
+                    else:
+                        qdrant_service.store_messages(points, wait=wait_for_index)
+                        
+                except Exception as e:
+                    logger.error(
+                        f"Failed to store embeddings for {len(detached_messages)} messages: {e}"
+                    )
+                    # Messages are still saved, just not linked to vectors
+                    self._unlink_vectors([message.id for message in detached_messages])
+                    for message in detached_messages:
+                        message.vector_id = None
+            
+            logger.info(
+                f"Saved {len(detached_messages)} messages to session {session_id}"
+            )
+            
+            return detached_messages
+            
+        except Exception as e:
+            logger.error(f"Failed to save messages: {e}")
+            raise RuntimeError(f"Could not save messages: {e}")
+    
+    def _lookup_cached_context(
+        self,
+        session_id_str: str,
+        query_embedding: np.ndarray,
+        cache_params: Tuple
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return context cached for a nearby query, if enabled and present."""
+        if not settings.context_cache_enabled:
+            return None
+        
+        cached = context_cache.lookup(session_id_str, query_embedding, cache_params)
+        if cached is not None:
+            logger.info(
+                f"Reused {len(cached)} cached context messages "
+                f"for session {session_id_str}"
+            )
+        return cached
+    
+    def _remember_context(
+        self,
+        session_id_str: str,
+        query_embedding: np.ndarray,
+        cache_params: Tuple,
+        results: List[Dict[str, Any]]
+    ):
+        """Log retrieved context and cache it for nearby follow-up queries."""
+        logger.info(
+            f"Retrieved {len(results)} relevant context messages "
+            f"for session {session_id_str}"
+        )
+        
+        if settings.context_cache_enabled:
+            context_cache.store(session_id_str, query_embedding, cache_params, results)
+    
     def get_relevant_context(
         self,
         session_id: UUID,
         query: str,
         limit: Optional[int] = None,
-        exclude_roles: Optional[List[str]] = None
+        exclude_roles: Optional[List[str]] = None,
+        precomputed_embedding: Optional[np.ndarray] = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve relevant context for a query using semantic search.
         
+        If a recent query in the same session was close enough to this one,
+        the context retrieved for it is reused instead of searching Qdrant.
+        
         Args:
             session_id: Session UUID
             query: Query text to find similar messages
             limit: Maximum number of context messages (default: from config)
             exclude_roles: Roles to exclude from results
+            precomputed_embedding: Embedding of query, if the caller
+                already has one (skips re-encoding)
         
         Returns:
             List of relevant messages with similarity scores
@@ -266,22 +531,90 @@ class ChatHistoryService:
         
         try:
             # Generate embedding for query
-            query_embedding = embedding_service.generate_embedding(query)
+            query_embedding = precomputed_embedding
+            if query_embedding is None:
+                query_embedding = embedding_batcher.embed(query)
+            
+            session_id_str = str(session_id)
+            cache_params = (limit, tuple(sorted(exclude_roles or ())))
+            
+            cached = self._lookup_cached_context(
+                session_id_str, query_embedding, cache_params
+            )
+            if cached is not None:
+                return cached
             
             # Search for similar messages in Qdrant
             results = qdrant_service.search_similar_messages(
                 query_embedding=query_embedding,
-                session_id=str(session_id),
+                session_id=session_id_str,
                 limit=limit,
                 score_threshold=settings.retrieval_score_threshold,
-                exclude_roles=exclude_roles
+                exclude_roles=exclude_roles,
+                fields=CONTEXT_FIELDS
             )
             
-            logger.info(
-                f"Retrieved {len(results)} relevant context messages "
-                f"for session {session_id}"
+            self._remember_context(session_id_str, query_embedding, cache_params, results)
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve context: {e}")
+            return []
+    
+    async def get_relevant_context_async(
+        self,
+        session_id: UUID,
+        query: str,
+        limit: Optional[int] = None,
+        exclude_roles: Optional[List[str]] = None,
+        precomputed_embedding: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve relevant context without blocking the event loop.
+        
+        Same as get_relevant_context, but awaits the embedding batcher and
+        the async Qdrant client instead of occupying a worker thread.
+        
+        Args:
+            session_id: Session UUID
+            query: Query text to find similar messages
+            limit: Maximum number of context messages (default: from config)
+            exclude_roles: Roles to exclude from results
+            precomputed_embedding: Embedding of query, if the caller
+                already has one (skips re-encoding)
+        
+        Returns:
+            List of relevant messages with similarity scores
+        """
+        if limit is None:
+            limit = settings.retrieval_top_k
+        
+        try:
+            query_embedding = precomputed_embedding
+            if query_embedding is None:
+                query_embedding = await embedding_batcher.embed_async(query)
+            
+            session_id_str = str(session_id)
+            cache_params = (limit, tuple(sorted(exclude_roles or ())))
+            
+            cached = self._lookup_cached_context(
+                session_id_str, query_embedding, cache_params
+            )
+            if cached is not None:
+                return cached
+            
+            results = await qdrant_service.asearch_similar_messages(
+                query_embedding=query_embedding,
+                session_id=session_id_str,
+                limit=limit,
+                score_threshold=settings.retrieval_score_threshold,
+                exclude_roles=exclude_roles,
+                fields=CONTEXT_FIELDS
             )
             
+            self._remember_context(session_id_str, query_embedding, cache_params, results)
+            
             return results
             
         except Exception as e:
@@ -293,94 +626,136 @@ class ChatHistoryService:
         session_id: UUID,
         limit: Optional[int] = None,
         offset: int = 0
-    ) -> List[ChatMessage]:
+    ) -> List[Row]:
         """
         Get all messages for a session (chronological order).
         
+        Selects only the columns the history view needs instead of loading
+        ORM objects, so no instances or identity-map entries are created.
+        The (session_id, timestamp) index returns the rows already ordered;
+        id breaks ties between rows saved in one transaction (e.g. by
+        save_messages_bulk), which share the transaction's now().
+        
         Args:
             session_id: Session UUID
             limit: Maximum number of messages
             offset: Number of messages to skip
         
         Returns:
-            List of ChatMessage objects
+            List of rows with id, role, content and timestamp (readable as
+            attributes, like ChatMessage)
         """
         try:
+            stmt = select(
+                ChatMessage.id,
+                ChatMessage.role,
+                ChatMessage.content,
+                ChatMessage.timestamp
+            ).where(
+                ChatMessage.session_id == session_id
+            ).order_by(ChatMessage.timestamp, ChatMessage.id)
+            
+            if offset:
+                stmt = stmt.offset(offset)
+            
+            if limit:
+                stmt = stmt.limit(limit)
+            
             with db_manager.session_scope() as db:
-                query = db.query(ChatMessage).filter(
-                    ChatMessage.session_id == session_id
-                ).order_by(ChatMessage.timestamp)
-                
-                if offset:
-                    query = query.offset(offset)
-                
-                if limit:
-                    query = query.limit(limit)
-                
-                messages = query.all()
-                
-                # Return detached message objects
-                detached_messages = []
-                for msg in messages:
-                    detached_messages.append(ChatMessage(
-                        id=msg.id,
-                        session_id=msg.session_id,
-                        role=msg.role,
-                        content=msg.content,
-                        timestamp=msg.timestamp,
-                        vector_id=msg.vector_id
-                    ))
-                
-                return detached_messages
+                return db.execute(stmt).all()
                 
         except Exception as e:
             logger.error(f"Failed to get session messages: {e}")
             return []
     
+    def count_session_messages(
+        self,
+        session_id: UUID
+    ) -> int:
+        """
+        Count the messages in a session without loading them.
+        
+        Args:
+            session_id: Session UUID
+        
+        Returns:
+            Number of messages in the session
+        """
+        try:
+            with db_manager.session_scope() as db:
+                # count(*) keeps the count answerable from ix_chat_messages_session_ts
+                return db.query(func.count()).select_from(ChatMessage).filter(
+                    ChatMessage.session_id == session_id
+                ).scalar() or 0
+                
+        except Exception as e:
+            logger.error(f"Failed to count session messages: {e}")
+            return 0
+    
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        before: Optional[Tuple[datetime, UUID]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get recent sessions, optionally filtered by user.
         
+        Sessions and their message counts are fetched in a single
+        aggregate query, selecting only the columns the response needs.
+        
         Args:
             user_id: Optional user identifier
             limit: Maximum number of sessions
+            before: (updated_at, session_id) of the last session on the
+                previous page - only sessions ordered after it are returned
+                (keyset pagination; session_id breaks updated_at ties)
         
         Returns:
-            List of session dictionaries with metadata
+            List of session dictionaries with metadata, most recently
+            updated first
         """
         try:
             with db_manager.session_scope() as db:
-                query = db.query(ChatSession).order_by(
-                    desc(ChatSession.updated_at)
+                query = db.query(
+                    ChatSession.session_id,
+                    ChatSession.user_id,
+                    ChatSession.created_at,
+                    ChatSession.updated_at,
+                    # Counts the index key column (NULL for sessions without
+                    # messages) so an index-only scan can be used
+                    func.count(ChatMessage.session_id).label("message_count")
+                ).outerjoin(
+                    ChatMessage,
+                    ChatMessage.session_id == ChatSession.session_id
+                ).group_by(
+                    ChatSession.session_id
+                ).order_by(
+                    desc(ChatSession.updated_at),
+                    desc(ChatSession.session_id)
                 )
                 
                 if user_id:
                     query = query.filter(ChatSession.user_id == user_id)
                 
-                query = query.limit(limit)
-                
-                sessions = query.all()
+                if before is not None:
+                    query = query.filter(
+                        tuple_(ChatSession.updated_at, ChatSession.session_id)
+                        < tuple_(*before)
+                    )
                 
-                # Format sessions with message counts
-                result = []
-                for session in sessions:
-                    message_count = db.query(ChatMessage).filter(
-                        ChatMessage.session_id == session.session_id
-                    ).count()
-                    
-                    result.append({
-                        "session_id": str(session.session_id),
-                        "user_id": session.user_id,
-                        "created_at": session.created_at.isoformat(),
-                        "updated_at": session.updated_at.isoformat(),
-                        "message_count": message_count
-                    })
+                rows = query.limit(limit).all()
                 
-                return result
+                return [
+                    {
+                        "session_id": str(row.session_id),
+                        "user_id": row.user_id,
+                        "created_at": row.created_at.isoformat(),
+                        "updated_at": row.updated_at.isoformat(),
+                        "message_count": row.message_count
+                    }
+                    for row in rows
+                ]
                 
         except Exception as e:
             logger.error(f"Failed to get recent sessions: {e}")
@@ -399,29 +774,31 @@ class ChatHistoryService:
         Returns:
             True if successful
         """
+        session_id_str = str(session_id)
+        
         try:
             # 1. Delete from Qdrant
-            deleted_count = qdrant_service.delete_session_messages(
-                str(session_id)
-            )
+            deleted_count = qdrant_service.delete_session_messages(session_id_str)
             logger.info(
                 f"Deleted {deleted_count} vectors from Qdrant "
-                f"for session {session_id}"
+                f"for session {session_id_str}"
             )
             
+            # Drop any cached replies and context for the session
+            semantic_cache.invalidate(session_id_str)
+            context_cache.invalidate(session_id_str)
+            session_cache.invalidate(session_id_str)
+            
             # 2. Delete from PostgreSQL (cascades to messages)
             with db_manager.session_scope() as db:
-                session = db.query(ChatSession).filter(
-                    ChatSession.session_id == session_id
-                ).first()
+                session = db.get(ChatSession, session_id)
                 
                 if session:
                     db.delete(session)
-                    db.commit()
-                    logger.info(f"Deleted session {session_id} from PostgreSQL")
+                    logger.info(f"Deleted session {session_id_str} from PostgreSQL")
                     return True
                 else:
-                    logger.warning(f"Session {session_id} not found")
+                    logger.warning(f"Session {session_id_str} not found")
                     return False
                     
         except Exception as e:
@@ -454,52 +831,43 @@ class ChatHistoryService:
         total_length = 0
         
         for msg in context_messages:
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-            score = msg.get('score', 0.0)
-            
             # Format: [User] message text (relevance: 0.85)
-            formatted = f"[{role.capitalize()}] {content} (relevance: {score:.2f})"
+            formatted = (
+                f"[{msg.get('role', 'unknown').capitalize()}] "
+                f"{msg.get('content', '')} "
+                f"(relevance: {msg.get('score', 0.0):.2f})"
+            )
             
             # Check length limit
-            if total_length + len(formatted) > max_length:
+            total_length += len(formatted)
+            if total_length > max_length:
                 break
             
             formatted_parts.append(formatted)
-            total_length += len(formatted)
         
         if not formatted_parts:
             return ""
         
-        # Combine into context block
-        context = "\n".join([
-            "Previously discussed (relevant context):",
-            "---",
-            *formatted_parts,
-            "---"
-        ])
-        
-        return context
+        # Combine into context block with a single join
+        return CONTEXT_HEADER + "\n".join(formatted_parts) + CONTEXT_FOOTER
     
-    def _update_session_timestamp(self, session_id: UUID):
+    def _update_session_timestamp(self, db: Session, session_id: UUID):
         """
-        Update session's updated_at timestamp.
+        Set the session's updated_at to the database's NOW().
+        
+        Issues a single UPDATE inside the caller's transaction instead of
+        loading the session row first.
         
         Args:
+            db: Active database session
             session_id: Session UUID
         """
-        try:
-            with db_manager.session_scope() as db:
-                session = db.query(ChatSession).filter(
-                    ChatSession.session_id == session_id
-                ).first()
-                
-                if session:
-                    session.updated_at = datetime.utcnow()
-                    db.commit()
-                    
-        except Exception as e:
-            logger.error(f"Failed to update session timestamp: {e}")
+        db.execute(
+            update(ChatSession)
+            .where(ChatSession.session_id == session_id)
+            .values(updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
     
     def get_session_stats(
         self,
@@ -516,35 +884,28 @@ class ChatHistoryService:
         """
         try:
             with db_manager.session_scope() as db:
-                session = db.query(ChatSession).filter(
-                    ChatSession.session_id == session_id
-                ).first()
+                session = db.get(ChatSession, session_id)
                 
                 if not session:
                     return {}
                 
-                # Count messages by role
-                user_count = db.query(ChatMessage).filter(
-                    ChatMessage.session_id == session_id,
-                    ChatMessage.role == 'user'
-                ).count()
+                # Count messages by role and get first/last message
+                # timestamps in one pass over the session's messages
+                stats = db.query(
+                    func.sum(case((ChatMessage.role == 'user', 1), else_=0)),
+                    func.sum(case((ChatMessage.role == 'assistant', 1), else_=0)),
+                    func.min(ChatMessage.timestamp),
+                    func.max(ChatMessage.timestamp)
+                ).filter(
+                    ChatMessage.session_id == session_id
+                ).one()
                 
-                assistant_count = db.query(ChatMessage).filter(
-                    ChatMessage.session_id == session_id,
-                    ChatMessage.role == 'assistant'
-                ).count()
+                user_count = int(stats[0] or 0)
+                assistant_count = int(stats[1] or 0)
+                first_message_at, last_message_at = stats[2], stats[3]
                 
                 total_count = user_count + assistant_count
                 
-                # Get first and last message timestamps
-                first_message = db.query(ChatMessage).filter(
-                    ChatMessage.session_id == session_id
-                ).order_by(ChatMessage.timestamp).first()
-                
-                last_message = db.query(ChatMessage).filter(
-                    ChatMessage.session_id == session_id
-                ).order_by(desc(ChatMessage.timestamp)).first()
-                
                 return {
                     "session_id": str(session_id),
                     "created_at": session.created_at.isoformat(),
@@ -552,8 +913,8 @@ class ChatHistoryService:
                     "total_messages": total_count,
                     "user_messages": user_count,
                     "assistant_messages": assistant_count,
-                    "first_message_at": first_message.timestamp.isoformat() if first_message else None,
-                    "last_message_at": last_message.timestamp.isoformat() if last_message else None,
+                    "first_message_at": first_message_at.isoformat() if first_message_at else None,
+                    "last_message_at": last_message_at.isoformat() if last_message_at else None,
                 }
                 
         except Exception as e:
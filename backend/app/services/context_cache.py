@@ -0,0 +1,172 @@
+"""
+Centroid cache for retrieved context.
+
+Consecutive turns in a session are often about the same topic. This cache
+remembers the last context retrieved for each session together with a
+centroid of the queries it was served for, so a follow-up query close to
+that centroid can reuse the context without another Qdrant search.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _ContextEntry:
+    """Cached context for a single session."""
+
+    __slots__ = ("centroid", "hits", "params", "results", "expires_at")
+
+    def __init__(
+        self,
+        centroid: np.ndarray,
+        params: Tuple,
+        results: List[Dict[str, Any]],
+        expires_at: float
+    ):
+        self.centroid = centroid
+        self.hits = 1
+        self.params = params
+        self.results = results
+        self.expires_at = expires_at
+
+
+class ContextCentroidCache:
+    """
+    Per-session cache of the most recent context retrieval.
+
+    An entry is reused when the cosine similarity between the new query
+    and the entry's centroid is at or above the threshold, the retrieval
+    parameters match, and the entry hasn't expired. Entries expire after
+    a short TTL because every turn adds new messages to the session.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        max_sessions: Optional[int] = None
+    ):
+        self.threshold = (
+            settings.context_cache_threshold if threshold is None else threshold
+        )
+        self.ttl_seconds = (
+            settings.context_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        self.max_sessions = max_sessions or settings.context_cache_max_sessions
+        self._entries: "OrderedDict[str, _ContextEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(
+        self,
+        session_id: str,
+        embedding: Union[List[float], np.ndarray],
+        params: Tuple
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find cached context for a query close to a previous one.
+
+        Args:
+            session_id: Session UUID (string form)
+            embedding: Normalized embedding of the query
+            params: Retrieval parameters the results depend on
+                (e.g. limit and excluded roles)
+
+        Returns:
+            Cached context messages, or None on a miss
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry.params != params:
+                return None
+
+            if entry.expires_at < time.monotonic():
+                del self._entries[session_id]
+                return None
+
+            centroid = entry.centroid
+            score = float(centroid @ query) / (float(np.linalg.norm(centroid)) or 1.0)
+
+            if score < self.threshold:
+                return None
+
+            # Fold the query into the centroid (running mean)
+            entry.centroid = centroid + (query - centroid) / (entry.hits + 1)
+            entry.hits += 1
+            self._entries.move_to_end(session_id)
+            results = entry.results
+
+        logger.debug(
+            f"Context cache hit for session {session_id} (score: {score:.3f})"
+        )
+        return results
+
+    def store(
+        self,
+        session_id: str,
+        embedding: Union[List[float], np.ndarray],
+        params: Tuple,
+        results: List[Dict[str, Any]]
+    ):
+        """
+        Cache the context retrieved for a query.
+
+        Args:
+            session_id: Session UUID (string form)
+            embedding: Normalized embedding of the query
+            params: Retrieval parameters the results depend on
+            results: Context messages returned by the search
+        """
+        entry = _ContextEntry(
+            centroid=np.asarray(embedding, dtype=np.float32),
+            params=params,
+            results=results,
+            expires_at=time.monotonic() + self.ttl_seconds
+        )
+
+        with self._lock:
+            self._entries[session_id] = entry
+            self._entries.move_to_end(session_id)
+
+            # Evict least recently used sessions
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str):
+        """
+        Drop cached context for a session.
+
+        Args:
+            session_id: Session UUID (string form)
+        """
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self):
+        """Drop all cached context."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global cache instance
+context_cache = ContextCentroidCache()
+
+
+def get_context_cache() -> ContextCentroidCache:
+    """
+    Get the global context cache instance.
+
+    Returns:
+        ContextCentroidCache instance
+    """
+    return context_cache
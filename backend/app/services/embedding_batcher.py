@@ -0,0 +1,186 @@
+"""
+Embedding micro-batcher.
+
+Collects single-text embedding requests from concurrent callers and encodes
+them together in one model call, so that small inputs can share the model
+overhead instead of paying it once per text.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.embedding_cache import embedding_cache
+from app.services.embedding_service import embedding_service, is_blank
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batcher in front of the embedding service.
+
+    Callers submit one text at a time and block (or await) on a future.
+    A background worker drains the queue, waiting at most ``max_wait_ms``
+    after the first request for more to arrive, and encodes up to
+    ``max_batch_size`` texts per model call.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None
+    ):
+        self.max_batch_size = max_batch_size or settings.embedding_batch_size
+        self.max_wait = (
+            settings.embedding_batch_max_wait_ms if max_wait_ms is None else max_wait_ms
+        ) / 1000.0
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_worker(self):
+        """Start the background worker thread on first use."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="embedding-batcher",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _collect_batch(self) -> List[Tuple[str, Future]]:
+        """
+        Block for the first request, then gather more until the batch is
+        full or the wait window has elapsed.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop - keeps running whatever a single batch does."""
+        while True:
+            try:
+                self._process_batch(self._collect_batch())
+            except Exception as e:
+                logger.error(f"Embedding batch worker error: {e}")
+
+    def _process_batch(self, batch: List[Tuple[str, Future]]):
+        """Encode one batch and resolve its futures."""
+        # Drop requests whose waiter has gone away (e.g. a cancelled
+        # asyncio.wrap_future); their futures can't take a result any more
+        batch = [
+            (text, future) for text, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+
+        try:
+            # submit() has already checked the cache for these texts
+            embeddings = embedding_service.generate_embeddings_batch(
+                texts, use_cache=False
+            )
+        except Exception as e:
+            logger.error(f"Batched embedding failed ({len(texts)} texts): {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (text, future), embedding in zip(batch, embeddings):
+            embedding_cache.put(text, embedding)
+            future.set_result(embedding)
+
+        logger.debug(f"Encoded embedding batch of {len(texts)} texts")
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for embedding.
+
+        Texts embedded recently are answered from the embedding cache
+        without queuing.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            Future resolving to the float32 embedding vector
+
+        Raises:
+            ValueError: If text is empty
+        """
+        if is_blank(text):
+            raise ValueError("Cannot generate embedding for empty text")
+
+        future: Future = Future()
+
+        cached = embedding_cache.get(text)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+
+        self._ensure_worker()
+        self._queue.put((text, future))
+        return future
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a text, blocking until its batch has been encoded.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            float32 embedding vector
+        """
+        return self.submit(text).result()
+
+    async def embed_async(self, text: str) -> np.ndarray:
+        """
+        Embed a text without blocking the event loop.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            float32 embedding vector
+        """
+        return await asyncio.wrap_future(self.submit(text))
+
+
+# Global batcher instance
+embedding_batcher = EmbeddingBatcher()
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """
+    Get the global embedding batcher instance.
+
+    Returns:
+        EmbeddingBatcher instance
+    """
+    return embedding_batcher
@@ -0,0 +1,134 @@
+"""
+Process-local cache of text embeddings.
+
+Users repeat questions, clients retry and test traffic replays the same
+prompts. Encoding is pure compute, so a repeated short text can reuse its
+earlier vector instead of running the tokenizer and model again.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+
+class EmbeddingCache:
+    """
+    LRU cache of normalized embeddings keyed by a digest of the text.
+
+    Only texts up to ``max_chars`` characters are cached - long texts
+    rarely repeat and would only push useful entries out. Keys are 16-byte
+    BLAKE2b digests of the stripped text (the tokenizer ignores leading and
+    trailing whitespace), so cached memory does not grow with text length.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ):
+        self.max_entries = (
+            settings.embedding_cache_size if max_entries is None else max_entries
+        )
+        self.max_chars = (
+            settings.embedding_cache_max_chars if max_chars is None else max_chars
+        )
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, text: str) -> Optional[bytes]:
+        """Return the cache key for a text, or None if it is not cacheable."""
+        if self.max_entries <= 0 or len(text) > self.max_chars:
+            return None
+        return hashlib.blake2b(text.strip().encode("utf-8"), digest_size=16).digest()
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        Get the cached embedding for a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Read-only float32 embedding, or None on a miss
+        """
+        key = self._key(text)
+        if key is None:
+            return None
+
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+            return embedding
+
+    def put(self, text: str, embedding: np.ndarray):
+        """
+        Cache the embedding for a text.
+
+        Stores a read-only copy, so a row of a batch matrix does not keep
+        the whole batch alive and no caller can modify a shared vector.
+
+        Args:
+            text: Input text
+            embedding: Normalized embedding vector
+        """
+        key = self._key(text)
+        if key is None:
+            return
+
+        embedding = np.array(embedding, dtype=np.float32)
+        embedding.setflags(write=False)
+
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+
+            # Evict least recently used texts
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage counters.
+
+        Returns:
+            Dictionary with entries, hits, misses and hit_rate (lookups of
+            uncacheable texts are not counted)
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+# Global cache instance
+embedding_cache = EmbeddingCache()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Get the global embedding cache instance.
+
+    Returns:
+        EmbeddingCache instance
+    """
+    return embedding_cache
@@ -6,15 +6,174 @@ used for similarity search in Qdrant.
 """
 
 import logging
-from typing import List, Union, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Tuple, Union, Optional
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from app.core.config import settings
+from app.services.embedding_cache import embedding_cache
+
+# SimSIMD has SIMD kernels for small vectors; fall back to NumPy where no
+# wheel is available for the platform
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# torch and sentence-transformers take seconds to import; they are loaded
+# on first use (normally the startup warmup) instead of at app import
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+    from app.services.onnx_embedding import OnnxEmbeddingModel
+    from app.services.static_embedding import StaticEmbeddingModel
 
 logger = logging.getLogger(__name__)
 
 
+def resolve_embedding_device(device: Optional[str] = None) -> str:
+    """
+    Resolve the configured embedding device.
+    
+    Args:
+        device: 'auto', 'cpu' or 'cuda' (defaults to settings.embedding_device)
+    
+    Returns:
+        Concrete device name - 'auto' picks CUDA when a GPU is available
+    """
+    device = device or settings.embedding_device
+    if device != "auto":
+        return device
+    
+    import torch
+    
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def resolve_embedding_dtype(device: str) -> str:
+    """
+    Resolve the configured weight precision for a device.
+    
+    Args:
+        device: Concrete device name (see resolve_embedding_device)
+    
+    Returns:
+        'fp32', 'fp16' or 'bf16' - always 'fp32' off CUDA; 'auto' picks
+        BF16 where the GPU supports it (Ampere and newer), else FP16
+    """
+    if not device.startswith("cuda"):
+        return "fp32"
+    
+    dtype = settings.embedding_dtype
+    if dtype != "auto":
+        return dtype
+    
+    import torch
+    
+    return "bf16" if torch.cuda.is_bf16_supported() else "fp16"
+
+
+def is_blank(text: Optional[str]) -> bool:
+    """
+    Check whether a text is empty or whitespace only.
+    
+    Uses str.isspace() rather than strip() so no stripped copy is built.
+    
+    Args:
+        text: Input text
+    
+    Returns:
+        True if the text has no non-whitespace characters
+    """
+    return not text or text.isspace()
+
+
+def _filter_valid(texts: List[str]) -> List[str]:
+    """Drop empty and whitespace-only texts."""
+    return [text for text in texts if text and not text.isspace()]
+
+
+@lru_cache(maxsize=1)
+def get_model() -> Union["SentenceTransformer", "OnnxEmbeddingModel", "StaticEmbeddingModel"]:
+    """
+    Load the configured embedding model (once per process).
+    
+    Shared by the embedding service and the configuration validator so
+    the model is only loaded once.
+    
+    Returns:
+        SentenceTransformer model on the resolved device, an int8 ONNX
+        model when EMBEDDING_BACKEND is 'onnx-int8', or a static model2vec
+        model when it is 'model2vec'
+    """
+    if settings.embedding_backend == "onnx-int8":
+        from app.services.onnx_embedding import OnnxEmbeddingModel
+        
+        logger.info(f"Loading embedding model: {settings.embedding_model} (ONNX int8)")
+        return OnnxEmbeddingModel(settings.embedding_model, settings.embedding_onnx_dir)
+    
+    if settings.embedding_backend == "model2vec":
+        from app.services.static_embedding import StaticEmbeddingModel
+        
+        logger.info(f"Loading embedding model: {settings.embedding_model} (model2vec)")
+        return StaticEmbeddingModel(settings.embedding_model)
+    
+    from sentence_transformers import SentenceTransformer
+    
+    device = resolve_embedding_device()
+    logger.info(f"Loading embedding model: {settings.embedding_model}")
+    logger.info(f"Device: {device}")
+    
+    model = SentenceTransformer(settings.embedding_model, device=device)
+    
+    # 16-bit weights halve memory traffic on GPU and use the Tensor Cores,
+    # with no meaningful loss in retrieval quality
+    dtype = resolve_embedding_dtype(device)
+    if dtype == "bf16":
+        model.bfloat16()
+    elif dtype == "fp16":
+        model.half()
+    logger.info(f"Weight precision: {dtype}")
+    
+    if settings.embedding_compile:
+        _compile_model(model)
+    
+    return model
+
+
+def _compile_model(model: "SentenceTransformer"):
+    """
+    Swap in fused attention kernels and compile the transformer module.
+    
+    BetterTransformer (from the optional optimum package) is applied when
+    available, then torch.compile with dynamic shapes so varying batch and
+    sequence lengths don't force recompiles. The first encodes trigger
+    compilation, which the startup warmup absorbs. Failures leave the
+    eager model in place.
+    
+    Args:
+        model: Loaded SentenceTransformer (modified in place)
+    """
+    import torch
+    
+    transformer = model[0]
+    
+    try:
+        from optimum.bettertransformer import BetterTransformer
+        
+        transformer.auto_model = BetterTransformer.transform(transformer.auto_model)
+        logger.info("Using BetterTransformer attention kernels")
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.warning(f"BetterTransformer not applied: {e}")
+    
+    try:
+        transformer.auto_model = torch.compile(transformer.auto_model, dynamic=True)
+        logger.info("Compiled embedding model with torch.compile")
+    except Exception as e:
+        logger.warning(f"torch.compile not applied: {e}")
+
+
 class EmbeddingService:
     """
     Service for generating text embeddings using sentence-transformers.
@@ -23,7 +182,11 @@ class EmbeddingService:
     """
     
     _instance: Optional['EmbeddingService'] = None
-    _model: Optional[SentenceTransformer] = None
+    _model: Optional[
+        Union["SentenceTransformer", "OnnxEmbeddingModel", "StaticEmbeddingModel"]
+    ] = None
+    _device: Optional[str] = None
+    _dimension: Optional[int] = None
     _initialized: bool = False
     
     def __new__(cls):
@@ -49,18 +212,14 @@ class EmbeddingService:
             return
         
         try:
-            logger.info(f"Loading embedding model: {settings.embedding_model}")
-            logger.info(f"Device: {settings.embedding_device}")
-            
-            # Load model with specified device
-            self._model = SentenceTransformer(
-                settings.embedding_model,
-                device=settings.embedding_device
-            )
+            # Load model (shared with any earlier get_model() caller)
+            self._model = get_model()
+            self._device = str(self._model.device)
             
-            # Verify dimensions
+            # Verify dimensions (this first encode also warms the model up)
             test_embedding = self._model.encode("test", show_progress_bar=False)
             actual_dim = len(test_embedding)
+            self._dimension = actual_dim
             
             if actual_dim != settings.embedding_dim:
                 logger.warning(
@@ -82,7 +241,7 @@ class EmbeddingService:
         self,
         text: str,
         normalize: bool = True
-    ) -> List[float]:
+    ) -> np.ndarray:
         """
         Generate embedding for a single text.
         
@@ -91,7 +250,8 @@ class EmbeddingService:
             normalize: Whether to normalize the embedding vector
         
         Returns:
-            List of floats representing the embedding vector
+            float32 array of shape (dim,); treat it as read-only, since
+            cached vectors are shared between callers
         
         Raises:
             RuntimeError: If model is not initialized
@@ -100,9 +260,14 @@ class EmbeddingService:
         if self._model is None:
             self._initialize_model()
         
-        if not text or not text.strip():
+        if is_blank(text):
             raise ValueError("Cannot generate embedding for empty text")
         
+        if normalize:
+            cached = embedding_cache.get(text)
+            if cached is not None:
+                return cached
+        
         try:
             # Generate embedding
             embedding = self._model.encode(
@@ -112,8 +277,13 @@ class EmbeddingService:
                 convert_to_numpy=True
             )
             
-            # Convert to list for JSON serialization
-            return embedding.tolist()
+            # float32 even when the model runs in FP16
+            embedding = embedding.astype(np.float32, copy=False)
+            
+            if normalize:
+                embedding_cache.put(text, embedding)
+            
+            return embedding
             
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
@@ -123,20 +293,25 @@ class EmbeddingService:
         self,
         texts: List[str],
         normalize: bool = True,
-        show_progress: bool = False
-    ) -> List[List[float]]:
+        show_progress: bool = False,
+        use_cache: bool = True
+    ) -> np.ndarray:
         """
         Generate embeddings for multiple texts (batch processing).
         
-        Batch processing is more efficient than individual calls.
+        Batch processing is more efficient than individual calls. Distinct
+        texts are encoded once, and (when normalizing) cached vectors are
+        reused and new ones cached.
         
         Args:
             texts: List of input texts to embed
             normalize: Whether to normalize the embedding vectors
             show_progress: Whether to show progress bar
+            use_cache: Whether to read and fill the embedding cache (callers
+                that have already looked the texts up pass False)
         
         Returns:
-            List of embedding vectors (one per input text)
+            float32 array of shape (N, dim), one row per non-empty text
         
         Raises:
             RuntimeError: If model is not initialized
@@ -149,7 +324,7 @@ class EmbeddingService:
             raise ValueError("Cannot generate embeddings for empty list")
         
         # Filter out empty texts
-        valid_texts = [text for text in texts if text and text.strip()]
+        valid_texts = _filter_valid(texts)
         
         if not valid_texts:
             raise ValueError("All input texts are empty")
@@ -159,18 +334,58 @@ class EmbeddingService:
                 f"Filtered out {len(texts) - len(valid_texts)} empty texts"
             )
         
-        try:
-            # Generate embeddings in batch
-            embeddings = self._model.encode(
-                valid_texts,
-                normalize_embeddings=normalize,
-                show_progress_bar=show_progress,
-                batch_size=settings.embedding_batch_size,
-                convert_to_numpy=True
+        # Encode each distinct text once (dict keeps first-seen order)
+        positions = {}
+        inverse = [positions.setdefault(text, len(positions)) for text in valid_texts]
+        unique_texts = list(positions)
+        
+        if len(unique_texts) < len(valid_texts):
+            logger.debug(
+                f"Encoding {len(unique_texts)} unique of {len(valid_texts)} texts"
             )
+        
+        # Reuse cached vectors and encode only the rest
+        use_cache = use_cache and normalize
+        cached = (
+            [embedding_cache.get(text) for text in unique_texts]
+            if use_cache else [None] * len(unique_texts)
+        )
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        
+        try:
+            if missing:
+                # Generate embeddings in batch
+                encoded = self._model.encode(
+                    [unique_texts[i] for i in missing],
+                    normalize_embeddings=normalize,
+                    show_progress_bar=show_progress,
+                    batch_size=settings.embedding_batch_size,
+                    convert_to_numpy=True
+                )
+                
+                # float32 even when the model runs in FP16
+                encoded = encoded.astype(np.float32, copy=False)
+            
+            if len(missing) == len(unique_texts):
+                embeddings = encoded
+            else:
+                dim = next(e for e in cached if e is not None).shape[-1]
+                embeddings = np.empty((len(unique_texts), dim), dtype=np.float32)
+                for i, embedding in enumerate(cached):
+                    if embedding is not None:
+                        embeddings[i] = embedding
+                if missing:
+                    embeddings[missing] = encoded
             
-            # Convert to list of lists for JSON serialization
-            return [emb.tolist() for emb in embeddings]
+            if use_cache:
+                for i in missing:
+                    embedding_cache.put(unique_texts[i], embeddings[i])
+            
+            # Fan the results back out to every input position
+            if len(unique_texts) < len(valid_texts):
+                embeddings = embeddings[inverse]
+            
+            return embeddings
             
         except Exception as e:
             logger.error(f"Error generating batch embeddings: {e}")
@@ -181,19 +396,16 @@ class EmbeddingService:
         Get the dimension of embeddings produced by this model.
         
         Returns:
-            Integer dimension of embedding vectors
+            Integer dimension of embedding vectors (measured once when the
+            model is loaded; the configured dimension before that)
         """
-        if self._model is None:
-            return settings.embedding_dim
-        
-        # Generate a test embedding to get actual dimension
-        test_embedding = self._model.encode("test", show_progress_bar=False)
-        return len(test_embedding)
+        return self._dimension or settings.embedding_dim
     
     def compute_similarity(
         self,
         embedding1: Union[List[float], np.ndarray],
-        embedding2: Union[List[float], np.ndarray]
+        embedding2: Union[List[float], np.ndarray],
+        assume_normalized: bool = False
     ) -> float:
         """
         Compute cosine similarity between two embeddings.
@@ -201,19 +413,97 @@ class EmbeddingService:
         Args:
             embedding1: First embedding vector
             embedding2: Second embedding vector
+            assume_normalized: Whether both vectors are unit length, so
+                cosine similarity is just the dot product. Pass True for
+                vectors from generate_embedding/generate_embeddings_batch
+                with normalize=True (the default) to skip the norms. SimSIMD,
+                when installed, always computes the full cosine, so the
+                flag only affects the NumPy fallback and never the result
         
         Returns:
             Similarity score between 0 and 1 (higher is more similar)
         """
-        # Convert to numpy arrays if needed
-        emb1 = np.array(embedding1) if isinstance(embedding1, list) else embedding1
-        emb2 = np.array(embedding2) if isinstance(embedding2, list) else embedding2
+        # Convert to contiguous float32 arrays (no copy for our own embeddings)
+        emb1 = np.ascontiguousarray(embedding1, dtype=np.float32)
+        emb2 = np.ascontiguousarray(embedding2, dtype=np.float32)
+        
+        if simsimd is not None:
+            # SimSIMD returns the cosine distance
+            return 1.0 - float(simsimd.cosine(emb1, emb2))
         
-        # Compute cosine similarity
         # For normalized vectors: similarity = dot product
-        similarity = np.dot(emb1, emb2) / (np.linalg.norm(emb1) * np.linalg.norm(emb2))
+        dot = float(np.dot(emb1, emb2))
+        if assume_normalized:
+            return dot
+        
+        # One sqrt over both squared norms instead of two norm() calls
+        return dot / float(np.sqrt(np.vdot(emb1, emb1) * np.vdot(emb2, emb2)))
+    
+    def compute_similarity_batch(
+        self,
+        query: Union[List[float], np.ndarray],
+        embeddings: Union[List[List[float]], np.ndarray],
+        assume_normalized: bool = False
+    ) -> np.ndarray:
+        """
+        Compute cosine similarity between one query and many embeddings.
+        
+        Args:
+            query: Query embedding vector
+            embeddings: (N, dim) matrix of embeddings to compare against
+            assume_normalized: Whether all vectors are unit length (see
+                compute_similarity)
+        
+        Returns:
+            float32 array of N similarity scores
+        """
+        query = np.ascontiguousarray(query, dtype=np.float32)
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        
+        if simsimd is not None:
+            distances = simsimd.cdist(query[None, :], matrix, metric="cosine")
+            return 1.0 - np.asarray(distances, dtype=np.float32).reshape(-1)
+        
+        scores = matrix @ query
+        if assume_normalized:
+            return scores
+        
+        norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix) * np.vdot(query, query))
+        return scores / norms
+    
+    def similarity_topk(
+        self,
+        query: Union[List[float], np.ndarray],
+        corpus: Union[List[List[float]], np.ndarray],
+        k: int,
+        assume_normalized: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k corpus embeddings most similar to a query.
+        
+        Scores the whole corpus in one call (see compute_similarity_batch)
+        and selects the top k with argpartition, sorting only those k.
+        
+        Args:
+            query: Query embedding vector
+            corpus: (N, dim) matrix of embeddings to search
+            k: Number of results (capped at N)
+            assume_normalized: Whether all vectors are unit length (see
+                compute_similarity)
+        
+        Returns:
+            Tuple of (indices, scores) for the top k, best first
+        """
+        scores = self.compute_similarity_batch(query, corpus, assume_normalized)
+        k = min(k, len(scores))
+        
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
         
-        return float(similarity)
+        return top, scores[top]
     
     def is_initialized(self) -> bool:
         """
@@ -234,9 +524,10 @@ class EmbeddingService:
         return {
             "model_name": settings.embedding_model,
             "dimension": self.get_embedding_dimension(),
-            "device": settings.embedding_device,
+            "device": self._device or resolve_embedding_device(),
             "batch_size": settings.embedding_batch_size,
             "initialized": self.is_initialized(),
+            "cache": embedding_cache.stats(),
         }
 
 
@@ -2,8 +2,10 @@
 Ollama service - handles all interactions with the Ollama API
 """
 
+import asyncio
 import httpx
-from typing import List, Dict, Optional
+import orjson
+from typing import AsyncIterator, List, Dict, Optional
 from fastapi import HTTPException
 import logging
 
@@ -11,6 +13,16 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Request bodies are encoded with orjson, so the content type is set by hand
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Appended to the system prompt after the retrieved context
+_CONTEXT_INSTRUCTIONS = """
+
+When answering, use the context above if it's relevant to the user's question. 
+Reference specific information from the context naturally in your responses.
+If the context doesn't contain relevant information, answer based on your general knowledge."""
+
 
 class OllamaService:
     """Service class for Ollama API interactions"""
@@ -20,6 +32,60 @@ class OllamaService:
         self.model = settings.ollama_model
         self.timeout = settings.ollama_timeout
         self.system_prompt = "You are a helpful assistant."
+        # Reused as-is for every request without context (only ever
+        # serialized, never modified)
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+        
+        The client keeps connections to Ollama alive between requests. It is
+        bound to the event loop it was created on, so a new one is created
+        if the running loop changes (e.g. between test clients).
+        
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        loop = asyncio.get_running_loop()
+        
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.ollama_max_connections,
+                    max_keepalive_connections=settings.ollama_max_keepalive_connections
+                )
+            )
+            self._client_loop = loop
+        
+        return self._client
+    
+    async def check_health(self) -> bool:
+        """
+        Check that Ollama is reachable (also opens a pooled connection).
+        
+        Returns:
+            True if Ollama responded successfully
+        """
+        try:
+            response = await self._get_client().get("/api/tags", timeout=5.0)
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"Ollama health check failed: {e}")
+            return False
+    
+    async def close(self):
+        """
+        Close the shared HTTP client and its connections.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
     
     async def generate_chat_response(
         self, 
@@ -41,15 +107,122 @@ class OllamaService:
         Raises:
             HTTPException: If the Ollama request fails
         """
+        # Prepare the payload for Ollama API
+        payload = {
+            "model": self.model,
+            "messages": self._build_messages(user_message, conversation_history, context),
+            "stream": False
+        }
+        
+        try:
+            client = self._get_client()
+            response = await client.post(
+                "/api/chat",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            
+            # Extract the assistant's reply from Ollama response
+            assistant_message = data.get("message", {})
+            content = assistant_message.get("content", "")
+            
+            if not content:
+                raise HTTPException(
+                    status_code=502,
+                    detail="Ollama returned empty response"
+                )
+            
+            return content
+            
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise self._to_http_exception(e)
+    
+    async def stream_chat_response(
+        self,
+        user_message: str,
+        context: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat response from Ollama token by token.
+        
+        Args:
+            user_message: The user's current message
+            context: Optional context string with relevant past information
+            
+        Yields:
+            Chunks of the assistant's response text as Ollama produces them
+            
+        Raises:
+            HTTPException: If the Ollama request fails
+        """
+        payload = {
+            "model": self.model,
+            "messages": self._build_messages(user_message, None, context),
+            "stream": True
+        }
+        
+        try:
+            client = self._get_client()
+            async with client.stream(
+                "POST",
+                "/api/chat",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+                
+                # Ollama streams one JSON object per line
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    
+                    data = orjson.loads(line)
+                    content = data.get("message", {}).get("content", "")
+                    
+                    if content:
+                        yield content
+                    
+                    if data.get("done"):
+                        break
+                
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise self._to_http_exception(e)
+    
+    def _build_messages(
+        self,
+        user_message: str,
+        conversation_history: Optional[List[Dict[str, str]]],
+        context: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """
+        Build the message array sent to Ollama.
+        
+        Args:
+            user_message: The user's current message
+            conversation_history: Optional list of previous messages (deprecated)
+            context: Optional context string with relevant past information
+        
+        Returns:
+            List of chat messages, starting with the system prompt
+        """
         # Build enhanced system prompt with context if available
-        system_content = self.system_prompt
+        system_message = self._system_message
         
         if context:
-            system_content = self._build_context_aware_prompt(context)
+            system_message = {
+                "role": "system",
+                "content": self._build_context_aware_prompt(context)
+            }
             logger.debug("Using context-aware system prompt")
         
         # Build the complete message array
-        messages = [{"role": "system", "content": system_content}]
+        messages = [system_message]
         
         # Add conversation history if provided (deprecated - for backward compatibility)
         if conversation_history:
@@ -58,54 +231,37 @@ class OllamaService:
         # Add the current user message
         messages.append({"role": "user", "content": user_message})
         
-        # Prepare the payload for Ollama API
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "stream": False
-        }
+        return messages
+    
+    def _to_http_exception(self, error: Exception) -> HTTPException:
+        """
+        Map an error raised while calling Ollama to an HTTPException.
         
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract the assistant's reply from Ollama response
-                assistant_message = data.get("message", {})
-                content = assistant_message.get("content", "")
-                
-                if not content:
-                    raise HTTPException(
-                        status_code=502,
-                        detail="Ollama returned empty response"
-                    )
-                
-                return content
-                
-        except httpx.TimeoutException:
-            raise HTTPException(
+        Args:
+            error: Exception raised by the HTTP client
+        
+        Returns:
+            HTTPException with a matching status code
+        """
+        if isinstance(error, httpx.TimeoutException):
+            return HTTPException(
                 status_code=504,
                 detail="Ollama request timed out. Please try again."
             )
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
+        if isinstance(error, httpx.HTTPStatusError):
+            return HTTPException(
                 status_code=502,
-                detail=f"Ollama API error: {e.response.status_code}"
+                detail=f"Ollama API error: {error.response.status_code}"
             )
-        except httpx.RequestError as e:
-            raise HTTPException(
+        if isinstance(error, httpx.RequestError):
+            return HTTPException(
                 status_code=502,
-                detail=f"Failed to connect to Ollama: {str(e)}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Unexpected error: {str(e)}"
+                detail=f"Failed to connect to Ollama: {str(error)}"
             )
+        return HTTPException(
+            status_code=500,
+            detail=f"Unexpected error: {str(error)}"
+        )
     
     def _build_context_aware_prompt(self, context: str) -> str:
         """
@@ -117,15 +273,7 @@ class OllamaService:
         Returns:
             Enhanced system prompt with context
         """
-        prompt = f"""{self.system_prompt}
-
-{context}
-
-When answering, use the context above if it's relevant to the user's question. 
-Reference specific information from the context naturally in your responses.
-If the context doesn't contain relevant information, answer based on your general knowledge."""
-        
-        return prompt
+        return f"{self.system_prompt}\n\n{context}{_CONTEXT_INSTRUCTIONS}"
     
     def get_model_info(self) -> Dict[str, str]:
         """
@@ -0,0 +1,153 @@
+"""
+ONNX Runtime int8 backend for the embedding model.
+
+Exports the sentence-transformers model to ONNX once, applies dynamic int8
+quantization and runs inference with ONNX Runtime on CPU. Pooling and
+normalization match sentence-transformers, so the vectors are
+interchangeable with the PyTorch backend for cosine retrieval.
+
+Requires the optional ``optimum[onnxruntime]`` dependency.
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+QUANTIZED_FILE_NAME = "model_quantized.onnx"
+
+
+class OnnxEmbeddingModel:
+    """
+    Int8-quantized ONNX model exposing the subset of the
+    ``SentenceTransformer.encode`` API used by the embedding service.
+    """
+
+    device = "cpu"
+
+    def __init__(self, model_name: str, cache_dir: str, max_seq_length: int = 256):
+        """
+        Load the quantized model, exporting and quantizing it on first use.
+
+        Args:
+            model_name: sentence-transformers model name or Hugging Face id
+            cache_dir: Directory for exported/quantized models
+            max_seq_length: Maximum tokens per text (matches the
+                sentence-transformers default for MiniLM models)
+
+        Raises:
+            RuntimeError: If optimum/onnxruntime are not installed
+        """
+        try:
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise RuntimeError(
+                "EMBEDDING_BACKEND=onnx-int8 requires optimum[onnxruntime]: "
+                f"{e}"
+            )
+
+        model_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        model_dir = Path(cache_dir) / model_id.replace("/", "__")
+
+        if not (model_dir / QUANTIZED_FILE_NAME).exists():
+            self._export_and_quantize(model_id, model_dir)
+
+        self._model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir,
+            file_name=QUANTIZED_FILE_NAME,
+            provider="CPUExecutionProvider"
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_seq_length = max_seq_length
+
+    @staticmethod
+    def _export_and_quantize(model_id: str, model_dir: Path):
+        """Export the model to ONNX and save a dynamic int8 quantized copy."""
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        logger.info(f"Exporting {model_id} to ONNX with int8 quantization...")
+
+        model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        quantizer.quantize(
+            save_dir=model_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(
+                is_static=False,
+                per_channel=False
+            )
+        )
+        model.config.save_pretrained(model_dir)
+        AutoTokenizer.from_pretrained(model_id).save_pretrained(model_dir)
+
+        logger.info(f"Quantized model saved to {model_dir}")
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False
+    ) -> np.ndarray:
+        """
+        Encode texts with mean pooling, like ``SentenceTransformer.encode``.
+        
+        Texts are encoded in length order (as sentence-transformers does)
+        so each batch is padded to similar lengths, then returned in the
+        original order.
+
+        Args:
+            sentences: A text or list of texts
+            batch_size: Texts per inference call
+            show_progress_bar: Ignored (kept for API compatibility)
+            convert_to_numpy: Ignored - always returns numpy
+            normalize_embeddings: Whether to L2-normalize the vectors
+
+        Returns:
+            float32 array of shape (dim,) for a single text, else (N, dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        # Longest first, so padding within each batch stays small
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        sorted_texts = [texts[i] for i in order]
+
+        batches = []
+        for start in range(0, len(sorted_texts), batch_size):
+            inputs = self._tokenizer(
+                sorted_texts[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_seq_length,
+                return_tensors="np"
+            )
+            token_embeddings = np.asarray(
+                self._model(**inputs).last_hidden_state,
+                dtype=np.float32
+            )
+
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            batches.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+
+        if not batches:
+            return np.empty((0, 0), np.float32)
+
+        # Restore the caller's order
+        sorted_embeddings = np.concatenate(batches)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings[0] if single else embeddings
@@ -4,28 +4,47 @@ Qdrant service for vector database operations.
 Handles storage, retrieval, and semantic search of message embeddings.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+import os
+import time
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-from qdrant_client import QdrantClient
+import grpc
+import httpx
+import numpy as np
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     VectorParams,
-    PointStruct,
     Filter,
-    FieldCondition,
-    MatchValue,
     Range,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    HnswConfigDiff,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    QuantizationSearchParams,
 )
 from qdrant_client.http import models as qdrant_models
+from qdrant_client.http.exceptions import UnexpectedResponse
 
 from app.core.config import settings
 from app.models.qdrant_schema import QdrantChatSchema
 
 logger = logging.getLogger(__name__)
 
+# Default payload fields returned with search results and session scrolls;
+# only the requested fields are sent by Qdrant
+SEARCH_RESULT_FIELDS = ("message_id", "session_id", "role", "content", "timestamp")
+SESSION_MESSAGE_FIELDS = ("message_id", "role", "content", "timestamp")
+
 
 class QdrantService:
     """
@@ -36,7 +55,22 @@ class QdrantService:
     
     _instance: Optional['QdrantService'] = None
     _client: Optional[QdrantClient] = None
+    _aclient: Optional[AsyncQdrantClient] = None
+    _aclient_loop: Optional[asyncio.AbstractEventLoop] = None
     _initialized: bool = False
+    _collection: str = ""
+    _score_threshold: float = 0.0
+    _search_params: Optional[SearchParams] = None
+    # (checked_at, points_count) - points_count is None while unhealthy
+    _health_cache: Tuple[float, Optional[int]] = (float("-inf"), None)
+    
+    # Payload fields indexed for filtering: session-scoped retrieval,
+    # role exclusion and time-based filtering
+    PAYLOAD_INDEXES = (
+        ("session_id", qdrant_models.PayloadSchemaType.KEYWORD),
+        ("role", qdrant_models.PayloadSchemaType.KEYWORD),
+        ("timestamp_unix", qdrant_models.PayloadSchemaType.INTEGER),
+    )
     
     def __new__(cls):
         """Singleton pattern - only one instance of the service."""
@@ -57,15 +91,20 @@ class QdrantService:
             logger.info("Qdrant client already initialized")
             return
         
+        # Settings are frozen, so hot-path values are read once here
+        self._collection = settings.qdrant_collection
+        self._score_threshold = settings.retrieval_score_threshold
+        self._search_params = self._get_search_params()
+        
         try:
-            logger.info(f"Connecting to Qdrant at {settings.qdrant_url}")
-            
-            # Initialize client
-            self._client = QdrantClient(
-                url=settings.qdrant_url,
-                timeout=10.0
+            logger.info(
+                f"Connecting to Qdrant at {settings.qdrant_url} "
+                f"(gRPC: {settings.qdrant_prefer_grpc})"
             )
             
+            # Initialize client - gRPC avoids HTTP/JSON overhead per call
+            self._client = QdrantClient(**self._connection_options())
+            
             # Ensure collection exists
             self._ensure_collection()
             
@@ -80,20 +119,16 @@ class QdrantService:
         """
         Create collection if it doesn't exist, or verify it matches our schema.
         """
-        collection_name = settings.qdrant_collection
+        collection_name = self._collection
         
         try:
-            # Check if collection exists
-            collections = self._client.get_collections().collections
-            collection_exists = any(
-                col.name == collection_name for col in collections
-            )
+            # One lookup both checks existence and fetches the config
+            collection_info = self._get_collection_info(collection_name)
             
-            if collection_exists:
+            if collection_info is not None:
                 logger.info(f"Collection '{collection_name}' already exists")
                 
                 # Verify collection configuration
-                collection_info = self._client.get_collection(collection_name)
                 vector_size = collection_info.config.params.vectors.size
                 
                 if vector_size != settings.embedding_dim:
@@ -101,16 +136,47 @@ class QdrantService:
                         f"Collection dimension mismatch: "
                         f"expected {settings.embedding_dim}, got {vector_size}"
                     )
+                
+                # Enable quantization on collections created without it
+                quantization_config = self._get_quantization_config()
+                if (
+                    quantization_config is not None
+                    and collection_info.config.quantization_config is None
+                ):
+                    logger.info(f"Enabling quantization on '{collection_name}'...")
+                    self._client.update_collection(
+                        collection_name=collection_name,
+                        quantization_config=quantization_config
+                    )
+                
+                # Add payload-aware HNSW links on collections created without them
+                hnsw_config = QdrantChatSchema.get_index_config()
+                if collection_info.config.hnsw_config.payload_m is None:
+                    logger.info(f"Enabling payload-aware HNSW on '{collection_name}'...")
+                    self._client.update_collection(
+                        collection_name=collection_name,
+                        hnsw_config=HnswConfigDiff(payload_m=hnsw_config["payload_m"])
+                    )
+                
+                # Collections created before an index was added won't have it
+                self._create_payload_indexes(
+                    existing=set(collection_info.payload_schema or {})
+                )
             else:
                 # Create collection
                 logger.info(f"Creating collection '{collection_name}'...")
                 
+                schema_config = QdrantChatSchema.get_collection_config()
+                
                 self._client.create_collection(
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=settings.embedding_dim,
                         distance=Distance.COSINE
-                    )
+                    ),
+                    hnsw_config=HnswConfigDiff(**schema_config["hnsw_config"]),
+                    on_disk_payload=schema_config["on_disk_payload"],
+                    quantization_config=self._get_quantization_config()
                 )
                 
                 # Create payload indexes for efficient filtering
@@ -122,35 +188,116 @@ class QdrantService:
             logger.error(f"Error ensuring collection exists: {e}")
             raise
     
-    def _create_payload_indexes(self):
+    def _get_collection_info(self, collection_name: str) -> Optional[Any]:
         """
-        Create indexes on payload fields for efficient filtering.
-        """
-        collection_name = settings.qdrant_collection
+        Fetch a collection's info.
+        
+        Args:
+            collection_name: Collection to look up
         
+        Returns:
+            CollectionInfo, or None if the collection doesn't exist
+        """
         try:
-            # Index session_id for session-based filtering
-            self._client.create_payload_index(
-                collection_name=collection_name,
-                field_name="session_id",
-                field_schema=qdrant_models.PayloadSchemaType.KEYWORD
+            return self._client.get_collection(collection_name)
+        except UnexpectedResponse as e:
+            if e.status_code == 404:
+                return None
+            raise
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+    
+    def _get_quantization_config(self):
+        """
+        Build the quantization config for the collection from settings.
+        
+        Scalar (int8) quantization keeps a 4x smaller copy of every vector
+        in RAM with little recall loss; binary quantization keeps a 1-bit
+        copy, which is cheaper still but loses more recall on small models.
+        Candidates are rescored with the original vectors
+        (see _get_search_params).
+        
+        Returns:
+            Quantization config, or None if quantization is disabled
+        """
+        if settings.qdrant_quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,  # Ignore outliers when fitting the int8 range
+                    always_ram=True
+                )
             )
-            
-            # Index role for filtering by message sender
-            self._client.create_payload_index(
-                collection_name=collection_name,
-                field_name="role",
-                field_schema=qdrant_models.PayloadSchemaType.KEYWORD
+        
+        if settings.qdrant_quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=True)
             )
-            
-            # Index timestamp_unix for time-based filtering
+        
+        return None
+    
+    def _get_search_params(self) -> SearchParams:
+        """
+        Build search parameters matching the collection's quantization.
+        
+        Returns:
+            SearchParams with the HNSW beam width and, if quantization is
+            enabled, rescoring/oversampling
+        """
+        quantization = None
+        if settings.qdrant_quantization != "none":
+            quantization = QuantizationSearchParams(
+                rescore=settings.qdrant_rescore,
+                oversampling=settings.qdrant_oversampling
+            )
+        
+        return SearchParams(
+            hnsw_ef=settings.qdrant_hnsw_ef,
+            quantization=quantization
+        )
+    
+    def _create_payload_indexes(self, existing: Optional[set] = None):
+        """
+        Create indexes on payload fields for efficient filtering.
+        
+        Without the session_id index, session-scoped searches fall back to
+        a full payload scan instead of being served by the index.
+        
+        Args:
+            existing: Names of fields that are already indexed (skipped)
+        """
+        collection_name = self._collection
+        existing = existing or set()
+        
+        missing = [
+            (field_name, field_schema)
+            for field_name, field_schema in self.PAYLOAD_INDEXES
+            if field_name not in existing
+        ]
+        
+        if not missing:
+            return
+        
+        def create_index(field: Tuple[str, Any]):
+            field_name, field_schema = field
             self._client.create_payload_index(
                 collection_name=collection_name,
-                field_name="timestamp_unix",
-                field_schema=qdrant_models.PayloadSchemaType.INTEGER
+                field_name=field_name,
+                field_schema=field_schema
+            )
+        
+        try:
+            # Qdrant builds each field's index independently, so the
+            # requests run concurrently instead of one round trip each
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                list(executor.map(create_index, missing))
+            
+            logger.info(
+                f"✅ Payload indexes created: "
+                f"{', '.join(name for name, _ in missing)}"
             )
-            
-            logger.info("✅ Payload indexes created")
             
         except Exception as e:
             logger.warning(f"Could not create payload indexes: {e}")
@@ -161,8 +308,9 @@ class QdrantService:
         session_id: str,
         role: str,
         content: str,
-        embedding: List[float],
-        timestamp: Optional[datetime] = None
+        embedding: np.ndarray,
+        timestamp: Optional[datetime] = None,
+        wait: bool = True
     ) -> str:
         """
         Store a message with its embedding in Qdrant.
@@ -174,6 +322,7 @@ class QdrantService:
             content: Message text content
             embedding: Vector embedding of the message
             timestamp: Message timestamp (default: now)
+            wait: Whether to wait until the point is indexed
         
         Returns:
             Point ID (UUID string) assigned to the message
@@ -181,55 +330,266 @@ class QdrantService:
         Raises:
             RuntimeError: If storage fails
         """
-        if self._client is None:
-            raise RuntimeError("Qdrant client not initialized")
+        return self.store_messages(
+            [{
+                "message_id": message_id,
+                "session_id": session_id,
+                "role": role,
+                "content": content,
+                "embedding": embedding,
+                "timestamp": timestamp,
+            }],
+            wait=wait
+        )[0]
+    
+    @staticmethod
+    def _prepare_points(
+        messages: List[Dict[str, Any]]
+    ) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+        """
+        Build point IDs, the vector matrix and payloads for messages.
         
-        if timestamp is None:
-            timestamp = datetime.utcnow()
+        Args:
+            messages: Message dictionaries as accepted by store_messages
         
-        # Generate unique point ID
-        point_id = str(uuid.uuid4())
+        Returns:
+            Tuple of (point IDs, float32 (N, dim) vectors, payloads), all in
+            the same order as the messages
+        """
+        # Build payloads per session so shared values are computed once
+        now = datetime.now(timezone.utc)
+        positions_by_session: Dict[str, List[int]] = {}
+        for position, message in enumerate(messages):
+            positions_by_session.setdefault(message["session_id"], []).append(position)
         
-        # Create payload using schema
-        payload = QdrantChatSchema.create_point_payload(
-            session_id=session_id,
-            message_id=message_id,
-            role=role,
-            content=content,
-            timestamp=timestamp
-        )
+        payloads: List[Dict[str, Any]] = [None] * len(messages)
+        for session_id, positions in positions_by_session.items():
+            session_payloads = QdrantChatSchema.create_point_payloads(
+                session_id,
+                (
+                    (
+                        messages[position]["message_id"],
+                        messages[position]["role"],
+                        messages[position]["content"],
+                        messages[position].get("timestamp") or now,
+                    )
+                    for position in positions
+                )
+            )
+            for position, payload in zip(positions, session_payloads):
+                payloads[position] = payload
+        
+        # Generate unique point IDs and stack the vectors column-wise
+        point_ids = [
+            message.get("point_id") or str(uuid.uuid4()) for message in messages
+        ]
+        vectors = np.stack(
+            [message["embedding"] for message in messages]
+        ).astype(np.float32, copy=False)
+        
+        return point_ids, vectors, payloads
+    
+    def store_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Store several messages with their embeddings in a single upsert.
+        
+        Args:
+            messages: Dictionaries with message_id, session_id, role, content,
+                embedding, optional timestamp (default: now) and optional
+                point_id (default: a new UUID)
+            wait: Whether to wait until the points are indexed
+        
+        Returns:
+            Point IDs (UUID strings) in the same order as the messages
+        
+        Raises:
+            RuntimeError: If storage fails
+        """
+        if self._client is None:
+            raise RuntimeError("Qdrant client not initialized")
+        
+        point_ids, vectors, payloads = self._prepare_points(messages)
         
         try:
-            # Create point
-            point = PointStruct(
-                id=point_id,
-                vector=embedding,
-                payload=payload
-            )
-            
             # Upload to Qdrant
             self._client.upsert(
-                collection_name=settings.qdrant_collection,
-                points=[point]
+                collection_name=self._collection,
+                points=QdrantChatSchema.build_batch(point_ids, vectors, payloads),
+                wait=wait
+            )
+            
+            logger.debug(f"Stored {len(point_ids)} messages in Qdrant")
+            
+            return point_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to store messages in Qdrant: {e}")
+            raise RuntimeError(f"Could not store message: {e}")
+    
+    def upload_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        parallel: Optional[int] = None,
+        wait: bool = True
+    ) -> List[str]:
+        """
+        Bulk-load many messages with the client's parallel uploader.
+        
+        Points are sent in batches of ``batch_size`` by ``parallel`` worker
+        processes, with retries - meant for imports and history replays
+        where a single upsert would be too large.
+        
+        Args:
+            messages: Message dictionaries as accepted by store_messages
+            batch_size: Points per request (default: QDRANT_UPLOAD_BATCH_SIZE)
+            parallel: Upload workers (default: QDRANT_UPLOAD_PARALLEL,
+                capped at the CPU count)
+            wait: Whether to wait until the points are indexed
+        
+        Returns:
+            Point IDs (UUID strings) in the same order as the messages
+        
+        Raises:
+            RuntimeError: If the upload fails
+        """
+        if self._client is None:
+            raise RuntimeError("Qdrant client not initialized")
+        
+        point_ids, vectors, payloads = self._prepare_points(messages)
+        
+        batch_size = batch_size or settings.qdrant_upload_batch_size
+        parallel = parallel or min(settings.qdrant_upload_parallel, os.cpu_count() or 1)
+        # Extra workers only pay off once there is a batch for each of them
+        parallel = max(1, min(parallel, -(-len(point_ids) // batch_size)))
+        
+        try:
+            self._client.upload_collection(
+                collection_name=self._collection,
+                vectors=vectors,
+                payload=payloads,
+                ids=point_ids,
+                batch_size=batch_size,
+                parallel=parallel,
+                wait=wait
             )
             
             logger.debug(
-                f"Stored message {message_id} in Qdrant with point ID {point_id}"
+                f"Uploaded {len(point_ids)} messages to Qdrant "
+                f"({parallel} workers)"
             )
             
-            return point_id
+            return point_ids
             
         except Exception as e:
-            logger.error(f"Failed to store message in Qdrant: {e}")
-            raise RuntimeError(f"Could not store message: {e}")
+            logger.error(f"Failed to upload messages to Qdrant: {e}")
+            raise RuntimeError(f"Could not upload messages: {e}")
+    
+    @staticmethod
+    def _connection_options() -> Dict[str, Any]:
+        """
+        Build the connection arguments shared by the sync and async clients.
+        
+        Each client keeps one long-lived gRPC channel (HTTP/2, so
+        concurrent calls are multiplexed over it). The REST fallback gets
+        a pooled keep-alive transport (plain HTTP/1.1 - httpx only
+        negotiates HTTP/2 over TLS). qdrant-client 1.7 forwards extra
+        keyword arguments to httpx only, so gRPC channel options can't be
+        set here.
+        
+        Returns:
+            Keyword arguments for QdrantClient / AsyncQdrantClient
+        """
+        return {
+            "host": settings.qdrant_host,
+            "port": settings.qdrant_port,
+            "grpc_port": settings.qdrant_grpc_port,
+            "prefer_grpc": settings.qdrant_prefer_grpc,
+            "timeout": 10,
+            # Passed through to the httpx client used for REST calls
+            "limits": httpx.Limits(
+                max_connections=settings.qdrant_max_connections,
+                max_keepalive_connections=settings.qdrant_max_connections // 2
+            ),
+        }
+    
+    def _get_async_client(self) -> AsyncQdrantClient:
+        """
+        Get the async client, creating it on first use.
+        
+        gRPC channels are bound to the event loop they were created on, so
+        the client is recreated if called from a different loop.
+        
+        Returns:
+            Shared AsyncQdrantClient instance
+        """
+        loop = asyncio.get_running_loop()
+        
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = AsyncQdrantClient(**self._connection_options())
+            self._aclient_loop = loop
+        
+        return self._aclient
+    
+    async def aclose(self):
+        """Close the async client (call on application shutdown)."""
+        if self._aclient is not None:
+            await self._aclient.close()
+            self._aclient = None
+            self._aclient_loop = None
+    
+    @staticmethod
+    def _build_search_filter(
+        session_id: Optional[str],
+        exclude_roles: Optional[List[str]]
+    ) -> Optional[Filter]:
+        """
+        Create the search filter - session must match, excluded roles must not.
+        
+        Returns:
+            Filter, or None when there are no conditions
+        """
+        if not (session_id or exclude_roles):
+            return None
+        
+        return Filter(
+            must=(
+                [QdrantChatSchema.session_condition(session_id)]
+                if session_id else None
+            ),
+            must_not=(
+                [QdrantChatSchema.roles_condition(exclude_roles)]
+                if exclude_roles else None
+            )
+        )
+    
+    @staticmethod
+    def _format_search_results(
+        results: List[Any],
+        fields: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """Convert scored points to message dictionaries with the given fields."""
+        formatted = []
+        for result in results:
+            get = result.payload.get
+            message = {"point_id": result.id, "score": result.score}
+            for field in fields:
+                message[field] = get(field)
+            formatted.append(message)
+        return formatted
     
     def search_similar_messages(
         self,
-        query_embedding: List[float],
+        query_embedding: np.ndarray,
         session_id: Optional[str] = None,
         limit: int = 5,
         score_threshold: Optional[float] = None,
-        exclude_roles: Optional[List[str]] = None
+        exclude_roles: Optional[List[str]] = None,
+        fields: Sequence[str] = SEARCH_RESULT_FIELDS
     ) -> List[Dict[str, Any]]:
         """
         Search for similar messages using vector similarity.
@@ -240,9 +600,11 @@ class QdrantService:
             limit: Maximum number of results
             score_threshold: Minimum similarity score (0-1)
             exclude_roles: Roles to exclude from results
+            fields: Payload fields to fetch and return (only these are
+                sent by Qdrant)
         
         Returns:
-            List of dictionaries with message data and scores
+            List of dictionaries with point_id, score and the requested fields
         
         Raises:
             RuntimeError: If search fails
@@ -251,64 +613,83 @@ class QdrantService:
             raise RuntimeError("Qdrant client not initialized")
         
         if score_threshold is None:
-            score_threshold = settings.retrieval_score_threshold
+            score_threshold = self._score_threshold
         
         try:
-            # Build filter conditions
-            filter_conditions = []
-            
-            if session_id:
-                filter_conditions.append(
-                    FieldCondition(
-                        key="session_id",
-                        match=MatchValue(value=session_id)
-                    )
-                )
+            results = self._client.search(
+                collection_name=self._collection,
+                query_vector=query_embedding,
+                query_filter=self._build_search_filter(session_id, exclude_roles),
+                search_params=self._search_params,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=list(fields),
+                with_vectors=False  # Don't return vectors to save bandwidth
+            )
             
-            if exclude_roles:
-                for role in exclude_roles:
-                    filter_conditions.append(
-                        FieldCondition(
-                            key="role",
-                            match=MatchValue(value=role),
-                        )
-                    )
+            formatted_results = self._format_search_results(results, fields)
             
-            # Create filter (if any conditions)
-            search_filter = None
-            if filter_conditions:
-                if exclude_roles:
-                    # Use must_not for exclude
-                    search_filter = Filter(
-                        must=[c for c in filter_conditions if "session_id" in str(c)],
-                        must_not=[c for c in filter_conditions if "role" in str(c)]
-                    )
-                else:
-                    search_filter = Filter(must=filter_conditions)
+            logger.debug(
+                f"Found {len(formatted_results)} similar messages "
+                f"(threshold: {score_threshold})"
+            )
             
-            # Perform search
-            results = self._client.search(
-                collection_name=settings.qdrant_collection,
+            return formatted_results
+            
+        except Exception as e:
+            logger.error(f"Failed to search similar messages: {e}")
+            raise RuntimeError(f"Could not search messages: {e}")
+    
+    async def asearch_similar_messages(
+        self,
+        query_embedding: np.ndarray,
+        session_id: Optional[str] = None,
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        exclude_roles: Optional[List[str]] = None,
+        fields: Sequence[str] = SEARCH_RESULT_FIELDS
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar messages without blocking the event loop.
+        
+        Same as search_similar_messages, but awaits the async client so
+        concurrent requests don't each hold a worker thread while Qdrant
+        searches.
+        
+        Args:
+            query_embedding: Vector embedding of the query
+            session_id: Filter by session (None = all sessions)
+            limit: Maximum number of results
+            score_threshold: Minimum similarity score (0-1)
+            exclude_roles: Roles to exclude from results
+            fields: Payload fields to fetch and return (only these are
+                sent by Qdrant)
+        
+        Returns:
+            List of dictionaries with point_id, score and the requested fields
+        
+        Raises:
+            RuntimeError: If search fails
+        """
+        if self._client is None:
+            raise RuntimeError("Qdrant client not initialized")
+        
+        if score_threshold is None:
+            score_threshold = self._score_threshold
+        
+        try:
+            results = await self._get_async_client().search(
+                collection_name=self._collection,
                 query_vector=query_embedding,
-                query_filter=search_filter,
+                query_filter=self._build_search_filter(session_id, exclude_roles),
+                search_params=self._search_params,
                 limit=limit,
                 score_threshold=score_threshold,
-                with_payload=True,
-                with_vectors=False  # Don't return vectors to save bandwidth
+                with_payload=list(fields),
+                with_vectors=False
             )
             
-            # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    "point_id": result.id,
-                    "score": result.score,
-                    "message_id": result.payload.get("message_id"),
-                    "session_id": result.payload.get("session_id"),
-                    "role": result.payload.get("role"),
-                    "content": result.payload.get("content"),
-                    "timestamp": result.payload.get("timestamp"),
-                })
+            formatted_results = self._format_search_results(results, fields)
             
             logger.debug(
                 f"Found {len(formatted_results)} similar messages "
@@ -321,53 +702,85 @@ class QdrantService:
             logger.error(f"Failed to search similar messages: {e}")
             raise RuntimeError(f"Could not search messages: {e}")
     
+    def iter_session_messages(
+        self,
+        session_id: str,
+        page_size: int = 256,
+        fields: Sequence[str] = SESSION_MESSAGE_FIELDS
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over all messages of a session.
+        
+        Pages through scroll results, fetching the next page only once
+        the previous one has been consumed. Nothing bounds the number of
+        messages - stop iterating (e.g. with islice) to read fewer, or use
+        get_session_messages, which is bounded by default.
+        
+        Args:
+            session_id: Session UUID
+            page_size: Points fetched per scroll request
+            fields: Payload fields to fetch and return
+        
+        Yields:
+            Message dictionaries with point_id and the requested fields
+        
+        Raises:
+            RuntimeError: If the client is not initialized
+        """
+        if self._client is None:
+            raise RuntimeError("Qdrant client not initialized")
+        
+        scroll_filter = Filter(must=[QdrantChatSchema.session_condition(session_id)])
+        offset = None
+        
+        while True:
+            results, offset = self._client.scroll(
+                collection_name=self._collection,
+                scroll_filter=scroll_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=list(fields),
+                with_vectors=False
+            )
+            
+            for result in results:
+                get = result.payload.get
+                message = {"point_id": result.id}
+                for field in fields:
+                    message[field] = get(field)
+                yield message
+            
+            if offset is None:
+                return
+    
     def get_session_messages(
         self,
         session_id: str,
-        limit: Optional[int] = None
+        limit: Optional[int] = 1000,
+        fields: Sequence[str] = SESSION_MESSAGE_FIELDS
     ) -> List[Dict[str, Any]]:
         """
-        Get all messages for a specific session.
+        Get the messages of a specific session.
         
         Args:
             session_id: Session UUID
-            limit: Maximum number of messages (None = all)
+            limit: Maximum number of messages; pass None to read every
+                message of the session
+            fields: Payload fields to fetch and return
         
         Returns:
-            List of message dictionaries
+            List of message dictionaries with point_id and the requested fields
         """
         if self._client is None:
             raise RuntimeError("Qdrant client not initialized")
         
         try:
-            # Scroll through all points with this session_id
-            results, _ = self._client.scroll(
-                collection_name=settings.qdrant_collection,
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="session_id",
-                            match=MatchValue(value=session_id)
-                        )
-                    ]
-                ),
-                limit=limit or 1000,
-                with_payload=True,
-                with_vectors=False
+            messages = self.iter_session_messages(
+                session_id,
+                page_size=min(limit, 256) if limit else 256,
+                fields=fields
             )
-            
-            # Format results
-            messages = []
-            for result in results:
-                messages.append({
-                    "point_id": result.id,
-                    "message_id": result.payload.get("message_id"),
-                    "role": result.payload.get("role"),
-                    "content": result.payload.get("content"),
-                    "timestamp": result.payload.get("timestamp"),
-                })
-            
-            return messages
+            return list(islice(messages, limit))
             
         except Exception as e:
             logger.error(f"Failed to get session messages: {e}")
@@ -388,7 +801,7 @@ class QdrantService:
         
         try:
             self._client.delete(
-                collection_name=settings.qdrant_collection,
+                collection_name=self._collection,
                 points_selector=[point_id]
             )
             
@@ -407,27 +820,31 @@ class QdrantService:
             session_id: Session UUID
         
         Returns:
-            Number of messages deleted
+            Number of messages deleted (counted just before the delete)
         """
         if self._client is None:
             raise RuntimeError("Qdrant client not initialized")
         
+        # One filter serves both the count and the delete
+        session_filter = Filter(must=[QdrantChatSchema.session_condition(session_id)])
+        
         try:
-            # Delete by filter
-            result = self._client.delete(
-                collection_name=settings.qdrant_collection,
-                points_selector=Filter(
-                    must=[
-                        FieldCondition(
-                            key="session_id",
-                            match=MatchValue(value=session_id)
-                        )
-                    ]
+            # The delete response only carries an operation ID, so count
+            # first (cheap - session_id is indexed)
+            deleted_count = self._client.count(
+                collection_name=self._collection,
+                count_filter=session_filter,
+                exact=True
+            ).count
+            
+            if deleted_count:
+                self._client.delete(
+                    collection_name=self._collection,
+                    points_selector=session_filter
                 )
-            )
             
-            logger.info(f"Deleted messages for session {session_id}")
-            return result.operation_id if result else 0
+            logger.info(f"Deleted {deleted_count} messages for session {session_id}")
+            return deleted_count
             
         except Exception as e:
             logger.error(f"Failed to delete session messages: {e}")
@@ -445,11 +862,11 @@ class QdrantService:
         
         try:
             collection_info = self._client.get_collection(
-                settings.qdrant_collection
+                self._collection
             )
             
             return {
-                "collection_name": settings.qdrant_collection,
+                "collection_name": self._collection,
                 "vector_size": collection_info.config.params.vectors.size,
                 "distance": collection_info.config.params.vectors.distance.name,
                 "points_count": collection_info.points_count,
@@ -465,27 +882,42 @@ class QdrantService:
         """
         Check if Qdrant is healthy and accessible.
         
+        The result is reused for HEALTH_CACHE_TTL_SECONDS so frequent
+        liveness probes don't each hit Qdrant.
+        
         Returns:
             True if healthy
         """
+        return self.get_health_points_count() is not None
+    
+    def get_health_points_count(self) -> Optional[int]:
+        """
+        Get the collection's point count from the health probe.
+        
+        The health probe already fetches the collection, so the count
+        comes with it and is cached for the same HEALTH_CACHE_TTL_SECONDS.
+        
+        Returns:
+            Number of points, or None if Qdrant is unhealthy
+        """
+        checked_at, points_count = self._health_cache
+        if time.monotonic() - checked_at < settings.health_cache_ttl_seconds:
+            return points_count
+        
+        points_count = None
         try:
-            if self._client is None:
-                return False
-            
-            # Try to get collections list
-            collections = self._client.get_collections()
-            
-            # Check if our collection exists
-            collection_exists = any(
-                col.name == settings.qdrant_collection
-                for col in collections.collections
-            )
-            
-            return collection_exists
+            if self._client is not None:
+                # Fetching our collection both checks the connection and
+                # confirms it exists, without listing every collection
+                collection_info = self._get_collection_info(self._collection)
+                if collection_info is not None:
+                    points_count = collection_info.points_count or 0
             
         except Exception as e:
             logger.error(f"Qdrant health check failed: {e}")
-            return False
+        
+        self._health_cache = (time.monotonic(), points_count)
+        return points_count
     
     def is_initialized(self) -> bool:
         """
@@ -0,0 +1,182 @@
+"""
+Qdrant write buffer.
+
+Collects single-message vector writes that nothing reads back immediately
+(e.g. assistant replies) and stores them in batched upserts from a
+background thread, so concurrent requests share one Qdrant round trip.
+Messages submitted without an embedding are encoded by the embedding
+batcher first, so the caller does not wait for the model either.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.embedding_batcher import embedding_batcher
+from app.services.embedding_service import is_blank
+from app.services.qdrant_service import qdrant_service
+
+logger = logging.getLogger(__name__)
+
+
+class QdrantWriteBuffer:
+    """
+    Background batcher in front of QdrantService.store_messages.
+
+    Point IDs are assigned on submit so callers can link them right away.
+    A worker thread waits at most ``max_wait_ms`` after the first queued
+    write for more to arrive and upserts up to ``max_batch_size`` points
+    per call, without waiting for indexing. Failed writes are logged.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None
+    ):
+        self.max_batch_size = max_batch_size or settings.qdrant_write_batch_size
+        self.max_wait = (
+            settings.qdrant_write_max_wait_ms if max_wait_ms is None else max_wait_ms
+        ) / 1000.0
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._embeddings_done = threading.Condition(self._lock)
+        self._pending_embeddings = 0
+
+    def _ensure_worker(self):
+        """Start the background worker thread on first use."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="qdrant-write-buffer",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """
+        Block for the first write, then gather more until the batch is
+        full or the wait window has elapsed.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        """Worker loop - upsert batches of buffered writes."""
+        while True:
+            batch = self._collect_batch()
+
+            try:
+                qdrant_service.store_messages(batch, wait=False)
+                logger.debug(f"Flushed {len(batch)} buffered Qdrant writes")
+            except Exception as e:
+                logger.error(f"Buffered Qdrant upsert failed ({len(batch)} points): {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def submit(self, message: Dict[str, Any]) -> str:
+        """
+        Queue a message vector for storage.
+
+        If the message has no embedding it is encoded in the background
+        first. Should that fail, the error is logged and no point is
+        stored under the returned ID.
+
+        Args:
+            message: Dictionary with message_id, session_id, role, content,
+                optional embedding, optional timestamp and optional point_id
+                (as for store_messages)
+
+        Returns:
+            Point ID the message will be stored under
+
+        Raises:
+            ValueError: If the message has no embedding and its content is
+                blank (there is nothing to embed)
+        """
+        if message.get("embedding") is None and is_blank(message.get("content")):
+            raise ValueError("Cannot store a vector for empty content")
+
+        self._ensure_worker()
+
+        point_id = message.get("point_id") or str(uuid.uuid4())
+        message = {**message, "point_id": point_id}
+
+        if message.get("embedding") is not None:
+            self._queue.put(message)
+            return point_id
+
+        future = embedding_batcher.submit(message["content"])
+
+        # Count the embedding only once it is actually pending, so a failed
+        # submit can't leave flush() waiting forever
+        with self._lock:
+            self._pending_embeddings += 1
+
+        future.add_done_callback(lambda done: self._on_embedded(message, done))
+        return point_id
+
+    def _on_embedded(self, message: Dict[str, Any], future: Future):
+        """Queue a message once its background embedding has finished."""
+        try:
+            message["embedding"] = future.result()
+            self._queue.put(message)
+        except Exception as e:
+            logger.error(
+                f"Failed to embed message {message['message_id']} "
+                f"for Qdrant: {e}"
+            )
+        finally:
+            with self._lock:
+                self._pending_embeddings -= 1
+                if self._pending_embeddings == 0:
+                    self._embeddings_done.notify_all()
+
+    def flush(self):
+        """Block until every queued write has been sent."""
+        with self._lock:
+            self._embeddings_done.wait_for(lambda: self._pending_embeddings == 0)
+
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.join()
+
+
+# Global buffer instance
+qdrant_write_buffer = QdrantWriteBuffer()
+
+# The app lifespan flushes on shutdown; this also drains writes queued by
+# scripts and tests that never start the app
+atexit.register(qdrant_write_buffer.flush)
+
+
+def get_qdrant_write_buffer() -> QdrantWriteBuffer:
+    """
+    Get the global Qdrant write buffer instance.
+
+    Returns:
+        QdrantWriteBuffer instance
+    """
+    return qdrant_write_buffer
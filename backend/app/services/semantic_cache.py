@@ -0,0 +1,154 @@
+"""
+Semantic cache for chat replies.
+
+Keeps a small per-session store of (query embedding, reply) pairs so that
+near-duplicate prompts can be answered without another LLM round-trip.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Union
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _SessionEntries:
+    """Embedding matrix and replies cached for a single session."""
+
+    __slots__ = ("matrix", "replies")
+
+    def __init__(self, dim: int):
+        self.matrix = np.empty((0, dim), dtype=np.float32)
+        self.replies: List[str] = []
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache keyed by session.
+
+    Each session owns one float32 matrix of shape (N, dim) holding the
+    normalized embeddings of previously answered prompts, so a lookup is a
+    single matrix-vector product followed by an argmax.
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_sessions: Optional[int] = None
+    ):
+        self.threshold = (
+            settings.semantic_cache_threshold if threshold is None else threshold
+        )
+        self.max_entries = max_entries or settings.semantic_cache_max_entries
+        self.max_sessions = max_sessions or settings.semantic_cache_max_sessions
+        self._sessions: "OrderedDict[str, _SessionEntries]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(
+        self,
+        session_id: str,
+        embedding: Union[List[float], np.ndarray]
+    ) -> Optional[str]:
+        """
+        Find a cached reply for a semantically equivalent prompt.
+
+        Args:
+            session_id: Session UUID (string form)
+            embedding: Normalized embedding of the incoming prompt
+
+        Returns:
+            Cached reply if the best match scores at or above the threshold,
+            otherwise None
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+
+        with self._lock:
+            entries = self._sessions.get(session_id)
+            if entries is None or not entries.replies:
+                return None
+
+            self._sessions.move_to_end(session_id)
+            scores = entries.matrix @ query
+            best = int(np.argmax(scores))
+            best_score = float(scores[best])
+            reply = entries.replies[best]
+
+        if best_score >= self.threshold:
+            logger.debug(
+                f"Semantic cache hit for session {session_id} "
+                f"(score: {best_score:.3f})"
+            )
+            return reply
+
+        return None
+
+    def store(
+        self,
+        session_id: str,
+        embedding: Union[List[float], np.ndarray],
+        reply: str
+    ):
+        """
+        Cache a reply for a prompt embedding.
+
+        Args:
+            session_id: Session UUID (string form)
+            embedding: Normalized embedding of the prompt
+            reply: Reply generated for the prompt
+        """
+        row = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+
+        with self._lock:
+            entries = self._sessions.get(session_id)
+            if entries is None:
+                entries = _SessionEntries(row.shape[1])
+                self._sessions[session_id] = entries
+
+                # Evict least recently used sessions
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session_id)
+
+            entries.matrix = np.vstack((entries.matrix, row))
+            entries.replies.append(reply)
+
+            # Keep only the most recent entries for the session
+            if len(entries.replies) > self.max_entries:
+                entries.matrix = entries.matrix[-self.max_entries:]
+                entries.replies = entries.replies[-self.max_entries:]
+
+    def invalidate(self, session_id: str):
+        """
+        Drop all cached replies for a session.
+
+        Args:
+            session_id: Session UUID (string form)
+        """
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def clear(self):
+        """Drop all cached replies."""
+        with self._lock:
+            self._sessions.clear()
+
+
+# Global cache instance
+semantic_cache = SemanticCache()
+
+
+def get_semantic_cache() -> SemanticCache:
+    """
+    Get the global semantic cache instance.
+
+    Returns:
+        SemanticCache instance
+    """
+    return semantic_cache
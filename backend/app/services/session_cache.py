@@ -0,0 +1,115 @@
+"""
+Process-local cache of known chat sessions.
+
+Every chat turn starts by looking up its session in PostgreSQL. Sessions
+are never modified on that path, so once a session has been seen this
+cache answers the lookup without a database round trip.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+from app.models.chat_models import ChatSession
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    LRU + TTL cache of detached ChatSession objects keyed by session ID.
+
+    Entries are dropped when the session is deleted through this process.
+    A session deleted through another worker can still be served until
+    the TTL expires; saving a message to it then fails the foreign key,
+    ChatHistoryService.save_message drops the entry and raises
+    SessionNotFoundError, and the chat route falls back to the database
+    (creating a new session, as for any unknown ID). Cached ``updated_at``
+    values are not refreshed, so callers that report timestamps should
+    read the database instead.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_sessions: Optional[int] = None
+    ):
+        self.ttl_seconds = (
+            settings.session_cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        )
+        self.max_sessions = max_sessions or settings.session_cache_max_sessions
+        self._entries: "OrderedDict[str, Tuple[ChatSession, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        """
+        Get a cached session.
+
+        Args:
+            session_id: Session UUID (string form)
+
+        Returns:
+            Detached ChatSession, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+
+            session, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[session_id]
+                return None
+
+            self._entries.move_to_end(session_id)
+            return session
+
+    def put(self, session: ChatSession):
+        """
+        Cache a session.
+
+        Args:
+            session: Detached ChatSession
+        """
+        session_id = str(session.session_id)
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._entries[session_id] = (session, expires_at)
+            self._entries.move_to_end(session_id)
+
+            # Evict least recently used sessions
+            while len(self._entries) > self.max_sessions:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str):
+        """
+        Drop a cached session.
+
+        Args:
+            session_id: Session UUID (string form)
+        """
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self):
+        """Drop all cached sessions."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global cache instance
+session_cache = SessionCache()
+
+
+def get_session_cache() -> SessionCache:
+    """
+    Get the global session cache instance.
+
+    Returns:
+        SessionCache instance
+    """
+    return session_cache
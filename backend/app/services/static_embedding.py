@@ -0,0 +1,85 @@
+"""
+model2vec backend for the embedding model.
+
+model2vec distills a sentence transformer into static token embeddings, so
+encoding a text is a tokenizer pass plus an average of embedding rows - no
+transformer forward pass. It is far faster on CPU at some cost in quality.
+
+Static models produce their own vector space (and usually a different
+dimension), so the whole collection must be embedded with the same backend.
+
+Requires the optional ``model2vec`` dependency.
+"""
+
+import logging
+from typing import List, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class StaticEmbeddingModel:
+    """
+    model2vec StaticModel exposing the subset of the
+    ``SentenceTransformer.encode`` API used by the embedding service.
+    """
+
+    device = "cpu"
+
+    def __init__(self, model_name: str):
+        """
+        Load a distilled static model.
+
+        Args:
+            model_name: model2vec model name or Hugging Face id
+                (e.g. ``minishlab/potion-base-8M``)
+
+        Raises:
+            RuntimeError: If model2vec is not installed
+        """
+        try:
+            from model2vec import StaticModel
+        except ImportError as e:
+            raise RuntimeError(f"EMBEDDING_BACKEND=model2vec requires model2vec: {e}")
+
+        self._model = StaticModel.from_pretrained(model_name)
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False
+    ) -> np.ndarray:
+        """
+        Encode texts, like ``SentenceTransformer.encode``.
+
+        Args:
+            sentences: A text or list of texts
+            batch_size: Texts per encode call
+            show_progress_bar: Whether to show a progress bar
+            convert_to_numpy: Ignored - always returns numpy
+            normalize_embeddings: Whether to L2-normalize the vectors
+
+        Returns:
+            float32 array of shape (dim,) for a single text, else (N, dim)
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+
+        embeddings = np.asarray(
+            self._model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=show_progress_bar
+            ),
+            dtype=np.float32
+        )
+
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+        return embeddings[0] if single else embeddings
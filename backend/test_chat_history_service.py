@@ -55,18 +55,16 @@ def test_chat_history_service():
             ("assistant", "Some popular Python libraries include NumPy, Pandas, and Django."),
         ]
         
-        saved_messages = []
-        
-        for role, content in test_messages:
-            message, point_id = chat_history_service.save_message(
-                session_id=session_id,
-                role=role,
-                content=content,
-                generate_embedding=True
-            )
-            
-            saved_messages.append(message)
-            logger.info(f"   Saved {role:9s} message (ID: {message.id}, Point: {point_id[:8]}...)")
+        # One bulk save: batched embeddings and a single Qdrant write
+        saved_messages = chat_history_service.save_messages_bulk(
+            session_id=session_id,
+            messages=test_messages,
+            generate_embedding=True
+        )
+        
+        for message in saved_messages:
+            point_id = message.vector_id or "none"
+            logger.info(f"   Saved {message.role:9s} message (ID: {message.id}, Point: {point_id[:8]}...)")
         
         logger.info(f"✅ Saved {len(saved_messages)} messages")
         
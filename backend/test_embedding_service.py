@@ -8,6 +8,8 @@ import sys
 import logging
 import time
 
+import numpy as np
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -53,7 +55,7 @@ def test_embedding_service():
         logger.info(f"✅ Generated embedding in {elapsed:.3f}s")
         logger.info(f"   Embedding dimension: {len(embedding)}")
         logger.info(f"   First 5 values: {embedding[:5]}")
-        logger.info(f"   Vector norm: {sum(x**2 for x in embedding)**0.5:.4f}")
+        logger.info(f"   Vector norm: {np.linalg.norm(embedding):.4f}")
         
         # Test 3: Generate batch embeddings
         logger.info("\n📋 Test 3: Generate Batch Embeddings")
@@ -84,12 +86,13 @@ def test_embedding_service():
         text2 = "Python is a great programming language."
         text3 = "What's the weather like today?"
         
-        emb1 = embedding_service.generate_embedding(text1)
-        emb2 = embedding_service.generate_embedding(text2)
-        emb3 = embedding_service.generate_embedding(text3)
+        # One forward pass for all three texts
+        emb1, emb2, emb3 = embedding_service.generate_embeddings_batch(
+            [text1, text2, text3]
+        )
         
-        sim_12 = embedding_service.compute_similarity(emb1, emb2)
-        sim_13 = embedding_service.compute_similarity(emb1, emb3)
+        sim_12 = embedding_service.compute_similarity(emb1, emb2, assume_normalized=True)
+        sim_13 = embedding_service.compute_similarity(emb1, emb3, assume_normalized=True)
         
         logger.info(f"Text 1: '{text1}'")
         logger.info(f"Text 2: '{text2}'")
@@ -120,24 +123,21 @@ def test_embedding_service():
         logger.info(f"Query: '{query}'")
         logger.info(f"Searching through {len(documents)} documents...")
         
-        query_emb = embedding_service.generate_embedding(query)
-        doc_embs = embedding_service.generate_embeddings_batch(documents)
-        
-        # Compute similarities
-        similarities = [
-            (i, doc, embedding_service.compute_similarity(query_emb, doc_emb))
-            for i, (doc, doc_emb) in enumerate(zip(documents, doc_embs))
-        ]
+        # Encode the query together with the documents
+        all_embs = embedding_service.generate_embeddings_batch([query, *documents])
+        query_emb, doc_embs = all_embs[0], all_embs[1:]
         
-        # Sort by similarity
-        similarities.sort(key=lambda x: x[2], reverse=True)
+        # Score all documents at once and keep the best 3
+        top_indices, top_scores = embedding_service.similarity_topk(
+            query_emb, doc_embs, k=3, assume_normalized=True
+        )
         
         logger.info("\nTop 3 most relevant documents:")
-        for rank, (idx, doc, score) in enumerate(similarities[:3], 1):
-            logger.info(f"  {rank}. [{score:.4f}] {doc}")
+        for rank, (idx, score) in enumerate(zip(top_indices, top_scores), 1):
+            logger.info(f"  {rank}. [{score:.4f}] {documents[idx]}")
         
         # Verify that Python-related docs are at the top
-        top_doc = similarities[0][1]
+        top_doc = documents[top_indices[0]]
         if "Python" in top_doc or "code" in top_doc or "tutorials" in top_doc:
             logger.info("✅ Semantic search works correctly")
         else:
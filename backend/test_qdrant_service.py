@@ -6,8 +6,9 @@ Run this to verify the Qdrant service works correctly.
 
 import sys
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -58,22 +59,31 @@ def test_qdrant_service():
             ("assistant", "I don't have access to weather data."),
         ]
         
+        # One batched encode and one upsert for all messages
+        embeddings = embedding_service.generate_embeddings_batch(
+            [content for _, content in test_messages]
+        )
+        now = datetime.now(timezone.utc)
+        
+        point_ids = qdrant_service.store_messages([
+            {
+                "message_id": idx,
+                "session_id": test_session_id,
+                "role": role,
+                "content": content,
+                "embedding": embedding,
+                "timestamp": now,
+            }
+            for idx, ((role, content), embedding) in enumerate(
+                zip(test_messages, embeddings), 1
+            )
+        ])
+        
         stored_points = []
         
-        for idx, (role, content) in enumerate(test_messages, 1):
-            # Generate embedding
-            embedding = embedding_service.generate_embedding(content)
-            
-            # Store in Qdrant
-            point_id = qdrant_service.store_message(
-                message_id=idx,
-                session_id=test_session_id,
-                role=role,
-                content=content,
-                embedding=embedding,
-                timestamp=datetime.utcnow()
-            )
-            
+        for idx, ((role, content), point_id) in enumerate(
+            zip(test_messages, point_ids), 1
+        ):
             stored_points.append((point_id, role, content))
             logger.info(f"   Stored message {idx}: {role[:4]}... → {point_id[:8]}...")
         
@@ -144,11 +154,36 @@ def test_qdrant_service():
             logger.error("❌ Session filtering failed")
             return False
         
+        # Tests 5-9 only read, so their Qdrant calls are issued together
+        # and each test checks its result in turn
+        high_threshold = 0.7
+        
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            session_messages_future = executor.submit(
+                qdrant_service.get_session_messages, test_session_id
+            )
+            user_only_future = executor.submit(
+                qdrant_service.search_similar_messages,
+                query_embedding=query_embedding,
+                session_id=test_session_id,
+                limit=10,
+                exclude_roles=["assistant"]
+            )
+            high_threshold_future = executor.submit(
+                qdrant_service.search_similar_messages,
+                query_embedding=query_embedding,
+                session_id=test_session_id,
+                limit=10,
+                score_threshold=high_threshold
+            )
+            info_future = executor.submit(qdrant_service.get_collection_info)
+            health_future = executor.submit(qdrant_service.check_health)
+        
         # Test 5: Get session messages
         logger.info("\n📋 Test 5: Get Session Messages")
         logger.info("-" * 60)
         
-        session_messages = qdrant_service.get_session_messages(test_session_id)
+        session_messages = session_messages_future.result()
         
         logger.info(f"Found {len(session_messages)} messages in session")
         
@@ -162,12 +197,7 @@ def test_qdrant_service():
         logger.info("-" * 60)
         
         # Search excluding assistant messages
-        results_user_only = qdrant_service.search_similar_messages(
-            query_embedding=query_embedding,
-            session_id=test_session_id,
-            limit=10,
-            exclude_roles=["assistant"]
-        )
+        results_user_only = user_only_future.result()
         
         all_user_messages = all(r['role'] == 'user' for r in results_user_only)
         
@@ -182,13 +212,7 @@ def test_qdrant_service():
         logger.info("-" * 60)
         
         # Search with high threshold
-        high_threshold = 0.7
-        results_high_threshold = qdrant_service.search_similar_messages(
-            query_embedding=query_embedding,
-            session_id=test_session_id,
-            limit=10,
-            score_threshold=high_threshold
-        )
+        results_high_threshold = high_threshold_future.result()
         
         # All scores should be above threshold
         all_above_threshold = all(
@@ -208,7 +232,7 @@ def test_qdrant_service():
         logger.info("\n📋 Test 8: Collection Information")
         logger.info("-" * 60)
         
-        info = qdrant_service.get_collection_info()
+        info = info_future.result()
         
         logger.info(f"Collection: {info.get('collection_name')}")
         logger.info(f"Total points: {info.get('points_count')}")
@@ -224,7 +248,7 @@ def test_qdrant_service():
         logger.info("\n📋 Test 9: Health Check")
         logger.info("-" * 60)
         
-        is_healthy = qdrant_service.check_health()
+        is_healthy = health_future.result()
         
         if is_healthy:
             logger.info("✅ Qdrant health check passed")
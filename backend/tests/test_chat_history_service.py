@@ -0,0 +1,47 @@
+"""
+Integration tests for chat history persistence.
+
+Messages saved together by save_messages_bulk are inserted in one
+transaction and share its timestamp, so history must still come back in
+the order the messages were given.
+"""
+
+import pytest
+
+from app.core.database import init_db
+from app.services.chat_history_service import chat_history_service
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    """Make sure the tables exist"""
+    init_db()
+
+
+@pytest.fixture
+def session():
+    """A fresh session, deleted after the test"""
+    session = chat_history_service.create_session()
+    yield session
+    chat_history_service.delete_session(session.session_id)
+
+
+class TestBulkSaveOrder:
+    """Bulk-saved messages keep their chronological order"""
+
+    def test_bulk_saved_messages_read_back_in_order(self, session):
+        """Rows with the same timestamp are returned in insertion order"""
+        messages = [
+            ("user" if i % 2 == 0 else "assistant", f"Message number {i}")
+            for i in range(20)
+        ]
+
+        chat_history_service.save_messages_bulk(
+            session.session_id,
+            messages,
+            generate_embedding=False
+        )
+
+        history = chat_history_service.get_session_messages(session.session_id)
+
+        assert [(row.role, row.content) for row in history] == messages
@@ -0,0 +1,56 @@
+"""
+Integration tests for the embedding micro-batcher.
+
+Waiters can go away while their text is queued (a client disconnects or
+a request times out), which cancels the underlying future. The worker
+must skip those and keep serving everyone else.
+"""
+
+import asyncio
+import uuid
+
+from app.services.embedding_batcher import EmbeddingBatcher
+
+
+RESULT_TIMEOUT_SECONDS = 30
+
+
+def unique_text(label: str) -> str:
+    """Text that can't be answered from the embedding cache"""
+    return f"{label} {uuid.uuid4()}"
+
+
+class TestCancelledWaiters:
+    """A cancelled waiter must not stop the batch worker"""
+
+    async def test_cancelled_waiter_does_not_break_its_batch(self):
+        """The rest of the batch and later requests still get embeddings"""
+        # A long wait window keeps both requests in the same batch
+        batcher = EmbeddingBatcher(max_batch_size=8, max_wait_ms=200)
+
+        cancelled = asyncio.ensure_future(batcher.embed_async(unique_text("cancelled")))
+        kept = asyncio.ensure_future(batcher.embed_async(unique_text("kept")))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+
+        embedding = await asyncio.wait_for(kept, RESULT_TIMEOUT_SECONDS)
+        assert embedding is not None
+        assert cancelled.cancelled()
+
+        later = await asyncio.wait_for(
+            batcher.embed_async(unique_text("later")),
+            RESULT_TIMEOUT_SECONDS
+        )
+        assert later.shape == embedding.shape
+
+    def test_cancelled_future_is_skipped(self):
+        """A future cancelled before encoding is left cancelled"""
+        batcher = EmbeddingBatcher(max_batch_size=8, max_wait_ms=200)
+
+        cancelled = batcher.submit(unique_text("cancelled"))
+        kept = batcher.submit(unique_text("kept"))
+        assert cancelled.cancel()
+
+        assert kept.result(timeout=RESULT_TIMEOUT_SECONDS) is not None
+        assert cancelled.cancelled()
@@ -0,0 +1,72 @@
+"""
+Integration tests for background vector writes.
+
+Assistant replies are stored with wait_for_index=False, so their
+embedding and Qdrant write happen in the QdrantWriteBuffer. A blank reply
+must neither break the save nor leave the buffer waiting on an embedding
+that was never queued (flush() runs at shutdown).
+"""
+
+import threading
+import uuid
+
+import pytest
+
+from app.core.database import init_db
+from app.services.chat_history_service import chat_history_service
+from app.services.qdrant_write_buffer import QdrantWriteBuffer, qdrant_write_buffer
+
+
+FLUSH_TIMEOUT_SECONDS = 10
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    """Make sure the tables exist"""
+    init_db()
+
+
+def assert_flush_returns(buffer: QdrantWriteBuffer):
+    """Fail instead of hanging if flush() never returns"""
+    flusher = threading.Thread(target=buffer.flush, daemon=True)
+    flusher.start()
+    flusher.join(FLUSH_TIMEOUT_SECONDS)
+    assert not flusher.is_alive(), "flush() did not return"
+
+
+class TestBlankContent:
+    """Blank content must not reach the embedding batcher"""
+
+    def test_submit_rejects_blank_content_without_embedding(self):
+        """Submitting a blank message raises and leaves nothing pending"""
+        buffer = QdrantWriteBuffer()
+
+        with pytest.raises(ValueError):
+            buffer.submit({
+                "message_id": 1,
+                "session_id": str(uuid.uuid4()),
+                "role": "assistant",
+                "content": "  \n\t ",
+            })
+
+        assert_flush_returns(buffer)
+
+    def test_blank_assistant_reply_is_saved_without_vector(self):
+        """A whitespace-only reply is stored unlinked and shutdown still drains"""
+        session = chat_history_service.create_session()
+
+        message, point_id = chat_history_service.save_message(
+            session_id=session.session_id,
+            role="assistant",
+            content="   ",
+            generate_embedding=True,
+            wait_for_index=False
+        )
+
+        assert message.id is not None
+        assert point_id is None
+        assert message.vector_id is None
+
+        assert_flush_returns(qdrant_write_buffer)
+
+        chat_history_service.delete_session(session.session_id)